@@ -266,25 +266,23 @@ def main():
     primitives = generate_primitives()
 
     # Write YAML - single document with background and body
-    yaml_content = """# HDraw Big Demo - Hundreds of SDF shapes
+    with open('/home/misi/work/my/yetty/demo/assets/cards/ydraw/big.yaml', 'w') as f:
+        f.write("""# HDraw Big Demo - Hundreds of SDF shapes
 # Generated demo showcasing all primitive types
 background: "#1a1a2e"
 body:
-"""
-
-    for prim in primitives:
-        for prim_type, params in prim.items():
-            yaml_content += f"  - {prim_type}:\n"
-            for key, value in params.items():
-                if isinstance(value, list):
-                    yaml_content += f"      {key}: [{', '.join(str(v) for v in value)}]\n"
-                elif isinstance(value, str):
-                    yaml_content += f"      {key}: \"{value}\"\n"
-                else:
-                    yaml_content += f"      {key}: {value}\n"
+""")
 
-    with open('/home/misi/work/my/yetty/demo/assets/cards/ydraw/big.yaml', 'w') as f:
-        f.write(yaml_content)
+        for prim in primitives:
+            for prim_type, params in prim.items():
+                f.write(f"  - {prim_type}:\n")
+                for key, value in params.items():
+                    if isinstance(value, list):
+                        f.write(f"      {key}: [{', '.join(str(v) for v in value)}]\n")
+                    elif isinstance(value, str):
+                        f.write(f"      {key}: \"{value}\"\n")
+                    else:
+                        f.write(f"      {key}: {value}\n")
 
     print(f"Generated {len(primitives)} primitives")
 
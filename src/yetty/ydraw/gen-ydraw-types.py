@@ -20,6 +20,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent  # src/yetty/ydraw -> project root
 
@@ -53,13 +58,41 @@ def camel_to_snake(name: str) -> str:
     return s.lower()
 
 
+def cpp_param_name(field_name: str) -> str:
+    """Field name as a C++ parameter (avoids keyword clashes)."""
+    return field_name + "_" if field_name in ("round",) else field_name
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def write_if_changed(path: Path, text: str) -> None:
+    """Write text atomically, leaving path untouched if content is identical.
+
+    Keeps the mtime stable so dependent C++/WGSL is not rebuilt needlessly.
+    Encoded once as UTF-8, independent of the locale.
+    """
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
 # =============================================================================
 # YAML loading + enrichment
 # =============================================================================
 
 def load_primitives(path: Path) -> list[dict]:
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    # Binary stream: libyaml decodes UTF-8 itself, skipping Python's text layer
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
 
     primitives = data["primitives"]
 
@@ -67,6 +100,8 @@ def load_primitives(path: Path) -> list[dict]:
         fields = prim.get("fields", [])
         offset_map: dict[str, tuple[int, str]] = {}
         for i, field in enumerate(fields):
+            # Interned names keep the many offset_map lookups in codegen cheap
+            field["name"] = sys.intern(field["name"])
             offset_map[field["name"]] = (i, field["type"])
         prim["_offset_map"] = offset_map
         prim["_word_count"] = len(fields)
@@ -80,6 +115,24 @@ def load_primitives(path: Path) -> list[dict]:
                 prim["_param_map"][field["name"]] = param_idx
                 param_idx += 1
 
+        # Flat per-field codegen tuples: (name, pname, off, is_u32, role, pidx).
+        # role is the field name for SDFPrimitive members, else "geom"/"geom_u32".
+        prim["_codegen_fields"] = [
+            (f["name"], cpp_param_name(f["name"]), i, f["type"] == "u32",
+             f["name"] if f["name"] in SPECIAL_FIELDS
+             else "geom_u32" if f["type"] == "u32" else "geom",
+             prim["_param_map"].get(f["name"]))
+            for i, f in enumerate(fields)
+        ]
+
+        # (parameter list, argument list) of write<Name> — 'type' is implicit
+        writer_fields = [cf for cf in prim["_codegen_fields"] if cf[4] != "type"]
+        prim["_writer_params"] = (
+            ", ".join(f"{'uint32_t' if is_u32 else 'float'} {pname}"
+                      for _, pname, _, is_u32, _, _ in writer_fields),
+            ", ".join(cf[1] for cf in writer_fields),
+        )
+
     return primitives
 
 
@@ -87,19 +140,63 @@ def load_primitives(path: Path) -> list[dict]:
 # Field substitution for WGSL eval blocks
 # =============================================================================
 
+FIELD_REF_RE = re.compile(r"\{(\w+)\}")
+
+
 def substitute_fields(eval_code: str, offset_map: dict) -> str:
     """{fieldName} → cardStorage[primOffset + Nu] (with bitcast for u32)."""
 
+    get = offset_map.get
+
     def _repl(m):
-        name = m.group(1)
-        if name not in offset_map:
+        entry = get(m.group(1))
+        if entry is None:
             return m.group(0)
-        offset, ftype = offset_map[name]
+        offset, ftype = entry
         if ftype == "u32":
             return f"bitcast<u32>(cardStorage[primOffset + {offset}u])"
         return f"cardStorage[primOffset + {offset}u]"
 
-    return re.sub(r"\{(\w+)\}", _repl, eval_code)
+    return FIELD_REF_RE.sub(_repl, eval_code)
+
+
+def eval_wgsl(prim: dict) -> str:
+    """Field-substituted WGSL eval block of prim ("" if none), computed once."""
+    code = prim.get("_eval_wgsl")
+    if code is None:
+        eval_code = prim.get("eval", "").strip()
+        code = substitute_fields(eval_code, prim["_offset_map"]) if eval_code else ""
+        prim["_eval_wgsl"] = code
+    return code
+
+
+# =============================================================================
+# Primitive partitioning — one pass shared by the WGSL generators
+# =============================================================================
+
+def partition_primitives(primitives: list[dict]) -> tuple[list[dict], ...]:
+    """Bucket primitives into (sdf2d, sdf3d, renderable, gradient, has_stroke).
+
+    renderable: fillColor + strokeColor + layer
+    gradient:   color1 + strokeColor + layer (color1 used as fillColor equivalent)
+    has_stroke: strokeWidth
+    """
+    sdf2d, sdf3d, renderable, gradient, has_stroke = [], [], [], [], []
+    for p in primitives:
+        om = p["_offset_map"]
+        category = p["category"]
+        if category == "sdf2d":
+            sdf2d.append(p)
+        elif category == "sdf3d":
+            sdf3d.append(p)
+        if "strokeColor" in om and "layer" in om:
+            if "fillColor" in om:
+                renderable.append(p)
+            if "color1" in om:
+                gradient.append(p)
+        if "strokeWidth" in om:
+            has_stroke.append(p)
+    return sdf2d, sdf3d, renderable, gradient, has_stroke
 
 
 # =============================================================================
@@ -122,13 +219,11 @@ def generate_cpp(primitives: list[dict], out: Path) -> None:
     # --- per-type field offsets ---
     L.append("namespace sdf_field {\n")
     for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
+        if not prim.get("fields"):
             continue
         L.append(f"namespace {prim['name']} {{")
-        for field in fields:
-            off = prim["_offset_map"][field["name"]][0]
-            cname = "k" + field["name"][0].upper() + field["name"][1:]
+        for name, _, off, _, _, _ in prim["_codegen_fields"]:
+            cname = "k" + name[0].upper() + name[1:]
             L.append(f"    constexpr uint32_t {cname} = {off};")
         L.append(f"    constexpr uint32_t kWordCount = {prim['_word_count']};")
         L.append("}\n")
@@ -137,15 +232,15 @@ def generate_cpp(primitives: list[dict], out: Path) -> None:
     L.append("} // namespace yetty::card")
     L.append("")
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(L))
+    write_if_changed(out, "\n".join(L))
 
 
 # =============================================================================
 # WGSL generation — constants + compact dispatch (renamed functions)
 # =============================================================================
 
-def generate_wgsl(primitives: list[dict], out: Path) -> None:
+def generate_wgsl(primitives: list[dict], partitions: tuple[list[dict], ...], out: Path) -> None:
+    sdf2d, sdf3d, renderable, gradient_prims, has_stroke = partitions
     L = []
     L.append(HEADER)
 
@@ -155,17 +250,15 @@ def generate_wgsl(primitives: list[dict], out: Path) -> None:
     L.append("")
 
     # --- evaluateYdrawSDF (2D) — compact layout dispatch ---
-    sdf2d = [p for p in primitives if p["category"] == "sdf2d"]
     if sdf2d:
         L.append("fn evaluateYdrawSDF(primOffset: u32, p: vec2<f32>) -> f32 {")
         L.append("    let primType = bitcast<u32>(cardStorage[primOffset + 0u]);")
         L.append("")
         L.append("    switch (primType) {")
         for prim in sdf2d:
-            eval_code = prim.get("eval", "").strip()
-            if not eval_code:
+            substituted = eval_wgsl(prim)
+            if not substituted:
                 continue
-            substituted = substitute_fields(eval_code, prim["_offset_map"])
             L.append(f"        case {prim['_const_name']}: {{")
             for line in substituted.split("\n"):
                 L.append(f"            {line}")
@@ -177,17 +270,15 @@ def generate_wgsl(primitives: list[dict], out: Path) -> None:
         L.append("}\n")
 
     # --- evaluateYdrawSDF3D ---
-    sdf3d = [p for p in primitives if p["category"] == "sdf3d"]
     if sdf3d:
         L.append("fn evaluateYdrawSDF3D(primOffset: u32, p: vec3<f32>) -> f32 {")
         L.append("    let primType = bitcast<u32>(cardStorage[primOffset + 0u]);")
         L.append("")
         L.append("    switch (primType) {")
         for prim in sdf3d:
-            eval_code = prim.get("eval", "").strip()
-            if not eval_code:
+            substituted = eval_wgsl(prim)
+            if not substituted:
                 continue
-            substituted = substitute_fields(eval_code, prim["_offset_map"])
             L.append(f"        case {prim['_const_name']}: {{")
             for line in substituted.split("\n"):
                 L.append(f"            {line}")
@@ -197,20 +288,6 @@ def generate_wgsl(primitives: list[dict], out: Path) -> None:
         L.append("}\n")
 
     # --- primColors ---
-    # Include regular primitives with fillColor
-    renderable = [
-        p for p in primitives
-        if "fillColor" in p["_offset_map"]
-        and "strokeColor" in p["_offset_map"]
-        and "layer" in p["_offset_map"]
-    ]
-    # Also include gradient primitives (use color1 as fillColor equivalent)
-    gradient_prims = [
-        p for p in primitives
-        if "color1" in p["_offset_map"]
-        and "strokeColor" in p["_offset_map"]
-        and "layer" in p["_offset_map"]
-    ]
     all_colorable = renderable + gradient_prims
     if all_colorable:
         L.append("fn primColors(primOffset: u32) -> vec4<u32> {")
@@ -300,7 +377,6 @@ def generate_wgsl(primitives: list[dict], out: Path) -> None:
         L.append("}\n")
 
     # --- primStrokeWidth ---
-    has_stroke = [p for p in primitives if "strokeWidth" in p["_offset_map"]]
     if has_stroke:
         L.append("fn primStrokeWidth(primOffset: u32) -> f32 {")
         L.append("    let primType = bitcast<u32>(cardStorage[primOffset + 0u]);")
@@ -313,114 +389,377 @@ def generate_wgsl(primitives: list[dict], out: Path) -> None:
         L.append("}")
         L.append("")
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(L))
+    write_if_changed(out, "\n".join(L))
 
 
 # =============================================================================
 # C++ writer generation — per-type inline write functions
 # =============================================================================
 
-def generate_writer(primitives: list[dict], out: Path) -> None:
-    L = []
-    L.append(HEADER)
-    L.append("#pragma once\n")
-    L.append("#include <cstdint>")
-    L.append("#include <cstring>")
-    L.append("#include <vector>\n")
-    L.append("// Forward declaration — include ydraw-types.gen.h for full enum")
-    L.append("namespace yetty::card { enum class SDFType : uint32_t; struct SDFPrimitive; }\n")
-    L.append("namespace yetty::sdf {\n")
-    L.append("namespace detail {")
-    L.append("inline void write_u32(float* buf, uint32_t off, uint32_t val) {")
-    L.append("    std::memcpy(&buf[off], &val, sizeof(uint32_t));")
-    L.append("}")
-    L.append("inline uint32_t read_u32(const float* buf, uint32_t off) {")
-    L.append("    uint32_t v; std::memcpy(&v, &buf[off], sizeof(uint32_t)); return v;")
-    L.append("}")
-    L.append("} // namespace detail\n")
-
-    # --- Per-type writer functions ---
-    for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
-            continue
-        fname = "write" + prim["name"]
+WRITER_FN_TEMPLATE = """\
+/// Write {name} ({wc} words). Returns word count.
+inline uint32_t write{name}(float* buf, {params}) {{
+    return detail::write_words(buf, {id}u, {args});
+}}
+"""
 
-        # Build parameter list (skip 'type' — it's implicit)
-        params = []
-        for field in fields:
-            if field["name"] == "type":
-                continue
-            # Avoid C++ keyword clash
-            pname = field["name"] + "_" if field["name"] in ("round",) else field["name"]
-            if field["type"] == "u32":
-                params.append(f"uint32_t {pname}")
-            else:
-                params.append(f"float {pname}")
 
-        param_str = ", ".join(params)
+# Per-role statement templates for readPrimitive / writePrimitive cases
+READ_FIELD_TEMPLATES = {
+    "type":        "prim.type = detail::read_u32(buf, {off});",
+    "layer":       "prim.layer = detail::read_u32(buf, {off});",
+    "fillColor":   "prim.fillColor = detail::read_u32(buf, {off});",
+    "strokeColor": "prim.strokeColor = detail::read_u32(buf, {off});",
+    "strokeWidth": "prim.strokeWidth = buf[{off}];",
+    "round":       "prim.round = buf[{off}];",
+    "geom":        "prim.params[{pidx}] = buf[{off}];",
+    "geom_u32":    "std::memcpy(&prim.params[{pidx}], &buf[{off}], sizeof(float));",
+    "geom_run":    "std::memcpy(&prim.params[{pidx}], &buf[{off}], {n} * sizeof(float));",
+    "member_run":  "std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, {member}), "
+                   "&buf[{off}], {n} * sizeof(float));",
+}
+
+WRITE_FIELD_TEMPLATES = {
+    "type":        "detail::write_u32(buf, {off}, prim.type);",
+    "layer":       "detail::write_u32(buf, {off}, prim.layer);",
+    "fillColor":   "detail::write_u32(buf, {off}, prim.fillColor);",
+    "strokeColor": "detail::write_u32(buf, {off}, prim.strokeColor);",
+    "strokeWidth": "buf[{off}] = prim.strokeWidth;",
+    "round":       "buf[{off}] = prim.round;",
+    "geom":        "buf[{off}] = prim.params[{pidx}];",
+    "geom_u32":    "std::memcpy(&buf[{off}], &prim.params[{pidx}], sizeof(float));",
+    "geom_run":    "std::memcpy(&buf[{off}], &prim.params[{pidx}], {n} * sizeof(float));",
+    "member_run":  "std::memcpy(&buf[{off}], reinterpret_cast<const char*>(&prim) + "
+                   "offsetof(card::SDFPrimitive, {member}), {n} * sizeof(float));",
+}
+
+
+def emit_writer_fn(prim: dict) -> str:
+    """Render the inline write<Name>() function for one primitive.
+
+    Field offsets are positional (type first), so the body is a single
+    detail::write_words() call with the arguments in layout order.
+    """
+    fields = prim["_codegen_fields"]
+    assert fields[0][4] == "type" and all(cf[2] == i for i, cf in enumerate(fields)), prim["name"]
+    params, args = prim["_writer_params"]
+    return WRITER_FN_TEMPLATE.format(
+        name=prim["name"], wc=prim["_word_count"], id=prim["id"], params=params, args=args)
+
+
+WRITER_PROLOGUE = """\
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <type_traits>
+#include <vector>
+
+// translateGridEntries picks an AVX2 kernel at runtime on x86-64 GCC/Clang.
+// The kernel carries its own target attribute, so no -mavx2 is required.
+#if (defined(__GNUC__) || defined(__clang__)) && defined(__x86_64__) && !defined(_MSC_VER)
+#define YETTY_SDF_AVX2_DISPATCH 1
+#include <immintrin.h>
+#else
+#define YETTY_SDF_AVX2_DISPATCH 0
+#endif
+
+// Small generated wrappers (buffer add/update methods) are forced inline
+// where the compiler supports it.
+#if defined(__GNUC__) || defined(__clang__)
+#define YETTY_SDF_ALWAYS_INLINE [[gnu::always_inline]] inline
+#else
+#define YETTY_SDF_ALWAYS_INLINE inline
+#endif
+
+// Forward declaration — include ydraw-types.gen.h for full enum
+namespace yetty::card { enum class SDFType : uint32_t; struct SDFPrimitive; }
+
+namespace yetty::sdf {
+
+namespace detail {
+inline void write_u32(float* buf, uint32_t off, uint32_t val) {
+    std::memcpy(&buf[off], &val, sizeof(uint32_t));
+}
+inline uint32_t read_u32(const float* buf, uint32_t off) {
+    uint32_t v; std::memcpy(&v, &buf[off], sizeof(uint32_t)); return v;
+}
+inline void store_word(float* buf, uint32_t off, float val) { buf[off] = val; }
+inline void store_word(float* buf, uint32_t off, uint32_t val) { write_u32(buf, off, val); }
+/// Store args to consecutive words from buf[0]; returns the word count.
+template<typename... Args>
+inline uint32_t write_words(float* buf, Args... args) {
+    uint32_t off = 0;
+    (store_word(buf, off++, args), ...);
+    return sizeof...(Args);
+}
+} // namespace detail
+"""
 
-        L.append(f"/// Write {prim['name']} ({prim['_word_count']} words). Returns word count.")
-        L.append(f"inline uint32_t {fname}(float* buf, {param_str}) {{")
+# translateGridEntries does NOT use SDFPrimitive, always available
+TRANSLATE_GRID_FN = """\
+namespace detail {
+/// Translate grid[idx..end): glyph entries (high bit set) and indices
+/// >= numOffsets pass through unchanged.
+inline void translateCellEntries(
+        uint32_t* __restrict grid, uint32_t idx, uint32_t end,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    for (; idx < end; idx++) {
+        uint32_t rawVal = grid[idx];
+        if ((rawVal & 0x80000000u) != 0) continue;
+        if (rawVal < numOffsets) {
+            grid[idx] = wordOffsets[rawVal];
+        }
+    }
+}
+
+/// Scalar kernel. Requires numCells <= gridSize.
+inline void translateGridEntriesScalar(
+        uint32_t* __restrict grid, uint32_t gridSize, uint32_t numCells,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    for (uint32_t ci = 0; ci < numCells; ci++) {
+        uint32_t packedOff = grid[ci];
+        if (packedOff >= gridSize) continue;
+        uint32_t cnt = grid[packedOff];
+        uint32_t idx = packedOff + 1;
+        uint32_t end = (cnt < gridSize - idx) ? idx + cnt : gridSize;
+        translateCellEntries(grid, idx, end, wordOffsets, numOffsets);
+    }
+}
+
+#if YETTY_SDF_AVX2_DISPATCH
+/// AVX2 kernel, 8 entries at a time: glyph lanes and out-of-range indices
+/// are masked out of the gather; the cell tail goes through the scalar loop.
+/// Requires numCells <= gridSize and a CPU with AVX2.
+[[gnu::target("avx2")]] inline void translateGridEntriesAvx2(
+        uint32_t* __restrict grid, uint32_t gridSize, uint32_t numCells,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    const int* offsetBase = reinterpret_cast<const int*>(wordOffsets);
+    const __m256i sizeVec = _mm256_set1_epi32(
+        static_cast<int>(numOffsets < 0x7fffffffu ? numOffsets : 0x7fffffffu));
+    for (uint32_t ci = 0; ci < numCells; ci++) {
+        uint32_t packedOff = grid[ci];
+        if (packedOff >= gridSize) continue;
+        uint32_t cnt = grid[packedOff];
+        uint32_t idx = packedOff + 1;
+        uint32_t end = (cnt < gridSize - idx) ? idx + cnt : gridSize;
+        for (; end - idx >= 8; idx += 8) {
+            __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(&grid[idx]));
+            __m256i isGlyph = _mm256_srai_epi32(v, 31);
+            __m256i inRange = _mm256_andnot_si256(isGlyph, _mm256_cmpgt_epi32(sizeVec, v));
+            v = _mm256_mask_i32gather_epi32(v, offsetBase, v, inRange, 4);
+            _mm256_storeu_si256(reinterpret_cast<__m256i*>(&grid[idx]), v);
+        }
+        translateCellEntries(grid, idx, end, wordOffsets, numOffsets);
+    }
+}
+#endif
+} // namespace detail
+
+/// Translate grid entries from primitive indices to word offsets.
+/// Grid layout: [off0..offN-1][packed_cells...] where cell = [count][e0][e1]...
+/// Non-glyph entries (prim indices) are replaced with word offsets.
+inline void translateGridEntries(
+        uint32_t* __restrict grid, uint32_t gridSize,
+        uint32_t gridW, uint32_t gridH,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    if (numOffsets == 0 || gridSize == 0) return;
+    uint32_t numCells = gridW * gridH;
+    if (numCells > gridSize) return;
+#if YETTY_SDF_AVX2_DISPATCH
+    if (__builtin_cpu_supports("avx2")) {
+        detail::translateGridEntriesAvx2(grid, gridSize, numCells, wordOffsets, numOffsets);
+        return;
+    }
+#endif
+    detail::translateGridEntriesScalar(grid, gridSize, numCells, wordOffsets, numOffsets);
+}
+
+/// Convenience overload for a std::vector of word offsets.
+inline void translateGridEntries(
+        uint32_t* grid, uint32_t gridSize,
+        uint32_t gridW, uint32_t gridH,
+        const std::vector<uint32_t>& wordOffsets) {
+    translateGridEntries(grid, gridSize, gridW, gridH,
+                         wordOffsets.data(), static_cast<uint32_t>(wordOffsets.size()));
+}
+"""
 
-        # Write each field
-        for field in fields:
-            off = prim["_offset_map"][field["name"]][0]
-            if field["name"] == "type":
-                L.append(f"    detail::write_u32(buf, {off}, {prim['id']}u);")
-            else:
-                pname = field["name"] + "_" if field["name"] in ("round",) else field["name"]
-                if field["type"] == "u32":
-                    L.append(f"    detail::write_u32(buf, {off}, {pname});")
-                else:
-                    L.append(f"    buf[{off}] = {pname};")
+# Compact GPU upload helpers + closing of the SDFPrimitive guard / namespace
+WRITER_EPILOGUE = """\
+/// Compute total bytes needed for compact prim buffer:
+/// [offset_table: count words] + [compact_prim_data]
+inline uint32_t computeCompactSize(
+        const card::SDFPrimitive* prims, uint32_t count) {
+    uint32_t dataWords = 0;
+    for (uint32_t i = 0; i < count; i++) {
+        uint32_t wc = wordCountForType(prims[i].type);
+        dataWords += (wc > 0) ? wc : 1;
+    }
+    return (count + dataWords) * sizeof(float);
+}
+
+/// Write compact format to GPU buffer: [offset_table][compact_data].
+/// Fills wordOffsets with per-prim word offsets (for grid translation).
+inline void writeCompactToBuffer(
+        float* buf, uint32_t bufBytes,
+        const card::SDFPrimitive* prims, uint32_t count,
+        std::vector<uint32_t>& wordOffsets) {
+    wordOffsets.resize(count);
+    float* dataBase = buf + count;
+    uint32_t dataOffset = 0;
+    for (uint32_t i = 0; i < count; i++) {
+        wordOffsets[i] = dataOffset;
+        uint32_t off = dataOffset;
+        std::memcpy(&buf[i], &off, sizeof(uint32_t));
+        uint32_t wc = writePrimitive(dataBase + dataOffset, prims[i]);
+        if (wc == 0) wc = 1;
+        dataOffset += wc;
+    }
+}
+
+#endif // YETTY_CARD_SDF_PRIMITIVE_DEFINED
+
+} // namespace yetty::sdf
+"""
 
-        L.append(f"    return {prim['_word_count']};")
-        L.append("}\n")
 
-    # --- wordCountForType: type ID → word count ---
+def emit_word_count_fn(primitives: list[dict]) -> str:
+    """wordCountForType: type ID → word count, as a direct-indexed table."""
+    wc_by_id = {p["id"]: p["_word_count"] for p in primitives}
+    size = max(wc_by_id) + 1
+    L = []
     L.append("/// Return word count for a given SDF type ID. 0 = unknown.")
     L.append("inline uint32_t wordCountForType(uint32_t type) {")
-    L.append("    switch (type) {")
-    for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
-            continue
-        L.append(f"    case {prim['id']}u: return {prim['_word_count']}; // {prim['name']}")
-    L.append("    default: return 0;")
-    L.append("    }")
+    L.append(f"    static constexpr uint32_t kWordCount[{size}] = {{")
+    for row in range(0, size, 16):
+        ids = range(row, min(row + 16, size))
+        L.append("        " + " ".join(f"{wc_by_id.get(i, 0):>2}," for i in ids) + f" // {row}..")
+    L.append("    };")
+    L.append(f"    return type < {size}u ? kWordCount[type] : 0u;")
     L.append("}\n")
+    return "\n".join(L)
+
+
+# SDFPrimitive members that are adjacent in every buffer layout using them;
+# copied as one block when they are adjacent in the struct as well.
+MEMBER_BLOCKS = {
+    ("type", "layer"): "kHeaderContiguous",
+    ("fillColor", "strokeColor", "strokeWidth", "round"): "kStyleContiguous",
+}
+
+# Buffer word type of each block member; a block memcpy only matches the
+# per-member statements when the SDFPrimitive member has exactly this type
+MEMBER_WORD_TYPES = {
+    "type": "uint32_t",
+    "layer": "uint32_t",
+    "fillColor": "uint32_t",
+    "strokeColor": "uint32_t",
+    "strokeWidth": "float",
+    "round": "float",
+}
+
+
+def member_block_at(fields: list[tuple], i: int) -> tuple[str, ...] | None:
+    """MEMBER_BLOCKS key starting at fields[i] with consecutive offsets, if any."""
+    for roles in MEMBER_BLOCKS:
+        seg = fields[i:i + len(roles)]
+        if (tuple(cf[4] for cf in seg) == roles
+                and all(cf[2] == seg[0][2] + k for k, cf in enumerate(seg))):
+            return roles
+    return None
+
+
+def field_runs(prim: dict) -> list[list[tuple]]:
+    """Group codegen fields into runs copied with one memcpy: MEMBER_BLOCKS,
+    and consecutive geometry fields contiguous in both the buffer and params[]."""
+    fields = prim["_codegen_fields"]
+    runs: list[list[tuple]] = []
+    i = 0
+    while i < len(fields):
+        block = member_block_at(fields, i)
+        if block:
+            runs.append(list(fields[i:i + len(block)]))
+            i += len(block)
+            continue
+        cf = fields[i]
+        _, _, off, _, _, pidx = cf
+        i += 1
+        if runs and pidx is not None:
+            _, _, last_off, _, _, last_pidx = runs[-1][-1]
+            if last_pidx is not None and off == last_off + 1 and pidx == last_pidx + 1:
+                runs[-1].append(cf)
+                continue
+        runs.append([cf])
+    return runs
+
+
+def emit_member_flags() -> str:
+    """constexpr detail::k*Contiguous checks of the SDFPrimitive layout."""
+    L = ["namespace detail {"]
+    for roles, flag in MEMBER_BLOCKS.items():
+        first = roles[0]
+        checks = ["std::is_standard_layout_v<card::SDFPrimitive>",
+                  "std::is_trivially_copyable_v<card::SDFPrimitive>"]
+        checks += [f"std::is_same_v<decltype(card::SDFPrimitive::{r}), {MEMBER_WORD_TYPES[r]}>"
+                   for r in roles]
+        checks += [f"offsetof(card::SDFPrimitive, {r}) == offsetof(card::SDFPrimitive, {first}) + {k} * sizeof(float)"
+                   for k, r in enumerate(roles) if k]
+        L.append(f"inline constexpr bool {flag} =")
+        L.append("    " + " &&\n    ".join(checks) + ";")
+    L.append("} // namespace detail\n")
+    return "\n".join(L)
+
+
+def emit_codec(prim: dict) -> str:
+    """Render the PrimCodec<SDFType::Name> specialization (read + write)."""
+    runs = field_runs(prim)
+
+    def single(templates: dict[str, str], cf: tuple) -> str:
+        return templates[cf[4]].format(off=cf[2], pidx=cf[5])
+
+    def body(templates: dict[str, str]) -> list[str]:
+        lines = []
+        for run in runs:
+            _, _, off, _, role, pidx = run[0]
+            roles = tuple(cf[4] for cf in run)
+            if roles in MEMBER_BLOCKS:
+                lines.append(f"        if constexpr (detail::{MEMBER_BLOCKS[roles]}) {{")
+                lines.append("            " + templates["member_run"].format(off=off, member=role, n=len(run)))
+                lines.append("        } else {")
+                lines.extend("            " + single(templates, cf) for cf in run)
+                lines.append("        }")
+            elif len(run) > 1:
+                lines.append("        " + templates["geom_run"].format(off=off, pidx=pidx, n=len(run)))
+            else:
+                lines.append("        " + single(templates, run[0]))
+        lines.append(f"        return {prim['_word_count']};")
+        return lines
 
-    # --- translateGridEntries: does NOT use SDFPrimitive, always available ---
-    L.append("/// Translate grid entries from primitive indices to word offsets.")
-    L.append("/// Grid layout: [off0..offN-1][packed_cells...] where cell = [count][e0][e1]...")
-    L.append("/// Non-glyph entries (prim indices) are replaced with word offsets.")
-    L.append("inline void translateGridEntries(")
-    L.append("        uint32_t* grid, uint32_t gridSize,")
-    L.append("        uint32_t gridW, uint32_t gridH,")
-    L.append("        const std::vector<uint32_t>& wordOffsets) {")
-    L.append("    if (wordOffsets.empty() || gridSize == 0) return;")
-    L.append("    uint32_t numCells = gridW * gridH;")
-    L.append("    if (numCells > gridSize) return;")
-    L.append("    for (uint32_t ci = 0; ci < numCells; ci++) {")
-    L.append("        uint32_t packedOff = grid[ci];")
-    L.append("        if (packedOff >= gridSize) continue;")
-    L.append("        uint32_t cnt = grid[packedOff];")
-    L.append("        for (uint32_t j = 0; j < cnt; j++) {")
-    L.append("            uint32_t idx = packedOff + 1 + j;")
-    L.append("            if (idx >= gridSize) break;")
-    L.append("            uint32_t rawVal = grid[idx];")
-    L.append("            if ((rawVal & 0x80000000u) != 0) continue;")
-    L.append("            if (rawVal < static_cast<uint32_t>(wordOffsets.size())) {")
-    L.append("                grid[idx] = wordOffsets[rawVal];")
-    L.append("            }")
-    L.append("        }")
+    L = [f"template<> struct PrimCodec<card::SDFType::{prim['name']}> {{"]
+    L.append("    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {")
+    L.extend(body(READ_FIELD_TEMPLATES))
     L.append("    }")
-    L.append("}\n")
+    L.append("    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {")
+    L.extend(body(WRITE_FIELD_TEMPLATES))
+    L.append("    }")
+    L.append("};\n")
+    return "\n".join(L)
+
 
-    # --- SDFPrimitive-dependent functions (need hdraw.h included first) ---
+def emit_read_write_primitive(primitives: list[dict]) -> str:
+    """PrimCodec specializations + readPrimitive / writePrimitive dispatch
+    (need SDFPrimitive, hdraw.h first)."""
+    L = []
     L.append("#ifdef YETTY_CARD_SDF_PRIMITIVE_DEFINED\n")
+    L.append(emit_member_flags())
+
+    # --- PrimCodec: per-type read/write, usable directly when type is known ---
+    L.append("/// Per-type codec. read() only sets the fields of that type's layout.")
+    L.append("template<card::SDFType T> struct PrimCodec;\n")
+    L.extend(emit_codec(prim) for prim in primitives)
 
     # --- readPrimitive: buffer → SDFPrimitive ---
     L.append("/// Read buffer into SDFPrimitive. Returns words consumed (0 = unknown type).")
@@ -428,40 +767,8 @@ def generate_writer(primitives: list[dict], out: Path) -> None:
     L.append("    std::memset(&prim, 0, sizeof(prim));")
     L.append("    uint32_t primType = detail::read_u32(buf, 0);")
     L.append("    switch (static_cast<card::SDFType>(primType)) {")
-
-    for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
-            continue
-        L.append(f"    case card::SDFType::{prim['name']}: {{")
-        for field in fields:
-            off = prim["_offset_map"][field["name"]][0]
-            fname = field["name"]
-            ftype = field["type"]
-
-            if fname == "type":
-                L.append(f"        prim.type = detail::read_u32(buf, {off});")
-            elif fname == "layer":
-                L.append(f"        prim.layer = detail::read_u32(buf, {off});")
-            elif fname == "fillColor":
-                L.append(f"        prim.fillColor = detail::read_u32(buf, {off});")
-            elif fname == "strokeColor":
-                L.append(f"        prim.strokeColor = detail::read_u32(buf, {off});")
-            elif fname == "strokeWidth":
-                L.append(f"        prim.strokeWidth = buf[{off}];")
-            elif fname == "round":
-                L.append(f"        prim.round = buf[{off}];")
-            else:
-                # Geometry param
-                pidx = prim["_param_map"][fname]
-                if ftype == "u32":
-                    L.append(f"        std::memcpy(&prim.params[{pidx}], &buf[{off}], sizeof(float));")
-                else:
-                    L.append(f"        prim.params[{pidx}] = buf[{off}];")
-
-        L.append(f"        return {prim['_word_count']};")
-        L.append("    }")
-
+    L.extend(f"    case card::SDFType::{p['name']}: "
+             f"return PrimCodec<card::SDFType::{p['name']}>::read(buf, prim);" for p in primitives)
     L.append("    default:")
     L.append("        return 0;")
     L.append("    }")
@@ -471,135 +778,59 @@ def generate_writer(primitives: list[dict], out: Path) -> None:
     L.append("/// Write SDFPrimitive to buffer. Returns word count (0 = unknown type).")
     L.append("inline uint32_t writePrimitive(float* buf, const card::SDFPrimitive& prim) {")
     L.append("    switch (static_cast<card::SDFType>(prim.type)) {")
-
-    for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
-            continue
-        L.append(f"    case card::SDFType::{prim['name']}: {{")
-        for field in fields:
-            off = prim["_offset_map"][field["name"]][0]
-            fname = field["name"]
-            ftype = field["type"]
-
-            if fname == "type":
-                L.append(f"        detail::write_u32(buf, {off}, prim.type);")
-            elif fname == "layer":
-                L.append(f"        detail::write_u32(buf, {off}, prim.layer);")
-            elif fname == "fillColor":
-                L.append(f"        detail::write_u32(buf, {off}, prim.fillColor);")
-            elif fname == "strokeColor":
-                L.append(f"        detail::write_u32(buf, {off}, prim.strokeColor);")
-            elif fname == "strokeWidth":
-                L.append(f"        buf[{off}] = prim.strokeWidth;")
-            elif fname == "round":
-                L.append(f"        buf[{off}] = prim.round;")
-            else:
-                pidx = prim["_param_map"][fname]
-                if ftype == "u32":
-                    L.append(f"        std::memcpy(&buf[{off}], &prim.params[{pidx}], sizeof(float));")
-                else:
-                    L.append(f"        buf[{off}] = prim.params[{pidx}];")
-
-        L.append(f"        return {prim['_word_count']};")
-        L.append("    }")
-
+    L.extend(f"    case card::SDFType::{p['name']}: "
+             f"return PrimCodec<card::SDFType::{p['name']}>::write(buf, prim);" for p in primitives)
     L.append("    default:")
     L.append("        return 0;")
     L.append("    }")
     L.append("}\n")
+    return "\n".join(L)
 
-    # --- Compact GPU upload helpers ---
-    L.append("/// Compute total bytes needed for compact prim buffer:")
-    L.append("/// [offset_table: count words] + [compact_prim_data]")
-    L.append("inline uint32_t computeCompactSize(")
-    L.append("        const card::SDFPrimitive* prims, uint32_t count) {")
-    L.append("    uint32_t dataWords = 0;")
-    L.append("    float tmp[24];")
-    L.append("    for (uint32_t i = 0; i < count; i++) {")
-    L.append("        uint32_t wc = writePrimitive(tmp, prims[i]);")
-    L.append("        dataWords += (wc > 0) ? wc : 1;")
-    L.append("    }")
-    L.append("    return (count + dataWords) * sizeof(float);")
-    L.append("}\n")
-
-    L.append("/// Write compact format to GPU buffer: [offset_table][compact_data].")
-    L.append("/// Fills wordOffsets with per-prim word offsets (for grid translation).")
-    L.append("inline void writeCompactToBuffer(")
-    L.append("        float* buf, uint32_t bufBytes,")
-    L.append("        const card::SDFPrimitive* prims, uint32_t count,")
-    L.append("        std::vector<uint32_t>& wordOffsets) {")
-    L.append("    wordOffsets.resize(count);")
-    L.append("    float* dataBase = buf + count;")
-    L.append("    uint32_t dataOffset = 0;")
-    L.append("    for (uint32_t i = 0; i < count; i++) {")
-    L.append("        wordOffsets[i] = dataOffset;")
-    L.append("        uint32_t off = dataOffset;")
-    L.append("        std::memcpy(&buf[i], &off, sizeof(uint32_t));")
-    L.append("        uint32_t wc = writePrimitive(dataBase + dataOffset, prims[i]);")
-    L.append("        if (wc == 0) wc = 1;")
-    L.append("        dataOffset += wc;")
-    L.append("    }")
-    L.append("}\n")
-
-    L.append("#endif // YETTY_CARD_SDF_PRIMITIVE_DEFINED\n")
 
-    L.append("} // namespace yetty::sdf")
-    L.append("")
+def generate_writer(primitives: list[dict], out: Path) -> None:
+    parts = [HEADER, WRITER_PROLOGUE]
+    parts.extend(emit_writer_fn(prim) for prim in primitives)
+    parts.append(emit_word_count_fn(primitives))
+    parts.append(TRANSLATE_GRID_FN)
+    parts.append(emit_read_write_primitive(primitives))
+    parts.append(WRITER_EPILOGUE)
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(L))
+    write_if_changed(out, "\n".join(parts))
 
 
 # =============================================================================
 # YDrawBuffer method generation — add/update per type
 # =============================================================================
 
-def generate_buffer(primitives: list[dict], out: Path) -> None:
-    L = []
-    L.append(HEADER)
-    L.append("// Included inside YDrawBuffer class body.\n")
+BUFFER_METHODS_TEMPLATE = """\
+YETTY_SDF_ALWAYS_INLINE Result<uint32_t> add{name}({params},
+        uint32_t id = AUTO_ID) {{
+    alignas(32) std::array<float, {wc}> data;
+    sdf::write{name}(data.data(), {args});
+    return addPrim(id, data.data(), {wc});
+}}
+
+YETTY_SDF_ALWAYS_INLINE Result<void> update{name}(uint32_t id, {params}) {{
+    alignas(32) std::array<float, {wc}> data;
+    sdf::write{name}(data.data(), {args});
+    return updatePrim(id, data.data(), {wc});
+}}
+"""
 
-    for prim in primitives:
-        fields = prim.get("fields", [])
-        if not fields:
-            continue
 
-        name = prim["name"]
-        wc = prim["_word_count"]
-        writer_fn = "sdf::write" + name
+def emit_buffer_methods(prim: dict) -> str:
+    """Render add<Name>() (new prim, error if user id exists) and
+    update<Name>() (replace existing, error if not found)."""
+    params, args = prim["_writer_params"]
+    return BUFFER_METHODS_TEMPLATE.format(
+        name=prim["name"], wc=prim["_word_count"], params=params, args=args)
 
-        # Build parameter list (skip 'type' — implicit in writer)
-        params = []
-        param_names = []
-        for field in fields:
-            if field["name"] == "type":
-                continue
-            pname = field["name"] + "_" if field["name"] in ("round",) else field["name"]
-            ctype = "uint32_t" if field["type"] == "u32" else "float"
-            params.append(f"{ctype} {pname}")
-            param_names.append(pname)
-
-        param_str = ", ".join(params)
-        arg_str = ", ".join(param_names)
-
-        # --- add method: creates new prim, error if user id exists ---
-        L.append(f"Result<uint32_t> add{name}({param_str},")
-        L.append(f"        uint32_t id = AUTO_ID) {{")
-        L.append(f"    float data[{wc}];")
-        L.append(f"    {writer_fn}(data, {arg_str});")
-        L.append(f"    return addPrim(id, data, {wc});")
-        L.append("}\n")
 
-        # --- update method: replaces existing, error if not found ---
-        L.append(f"Result<void> update{name}(uint32_t id, {param_str}) {{")
-        L.append(f"    float data[{wc}];")
-        L.append(f"    {writer_fn}(data, {arg_str});")
-        L.append(f"    return updatePrim(id, data, {wc});")
-        L.append("}\n")
+def generate_buffer(primitives: list[dict], out: Path) -> None:
+    parts = [HEADER, "// Included inside YDrawBuffer class body.\n"]
+    parts.extend(emit_buffer_methods(prim) for prim in primitives)
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(L))
+    write_if_changed(out, "\n".join(parts))
 
 
 # =============================================================================
@@ -612,11 +843,14 @@ def main() -> None:
         sys.exit(1)
 
     primitives = load_primitives(YAML_PATH)
+    partitions = partition_primitives(primitives)
+    # The C++ writer/buffer code only covers primitives with a buffer layout
+    with_fields = [p for p in primitives if p.get("fields")]
 
     generate_cpp(primitives, CPP_OUT)
-    generate_wgsl(primitives, WGSL_OUT)
-    generate_writer(primitives, WRITER_OUT)
-    generate_buffer(primitives, BUFFER_OUT)
+    generate_wgsl(primitives, partitions, WGSL_OUT)
+    generate_writer(with_fields, WRITER_OUT)
+    generate_buffer(with_fields, BUFFER_OUT)
 
     # Summary
     cats = {}
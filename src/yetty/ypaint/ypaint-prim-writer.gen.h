@@ -4,10 +4,30 @@
 
 #pragma once
 
+#include <array>
+#include <cstddef>
 #include <cstdint>
 #include <cstring>
+#include <type_traits>
 #include <vector>
 
+// translateGridEntries picks an AVX2 kernel at runtime on x86-64 GCC/Clang.
+// The kernel carries its own target attribute, so no -mavx2 is required.
+#if (defined(__GNUC__) || defined(__clang__)) && defined(__x86_64__) && !defined(_MSC_VER)
+#define YETTY_SDF_AVX2_DISPATCH 1
+#include <immintrin.h>
+#else
+#define YETTY_SDF_AVX2_DISPATCH 0
+#endif
+
+// Small generated wrappers (buffer add/update methods) are forced inline
+// where the compiler supports it.
+#if defined(__GNUC__) || defined(__clang__)
+#define YETTY_SDF_ALWAYS_INLINE [[gnu::always_inline]] inline
+#else
+#define YETTY_SDF_ALWAYS_INLINE inline
+#endif
+
 // Forward declaration — include ydraw-types.gen.h for full enum
 namespace yetty::card { enum class SDFType : uint32_t; struct SDFPrimitive; }
 
@@ -20,2837 +40,2992 @@ inline void write_u32(float* buf, uint32_t off, uint32_t val) {
 inline uint32_t read_u32(const float* buf, uint32_t off) {
     uint32_t v; std::memcpy(&v, &buf[off], sizeof(uint32_t)); return v;
 }
+inline void store_word(float* buf, uint32_t off, float val) { buf[off] = val; }
+inline void store_word(float* buf, uint32_t off, uint32_t val) { write_u32(buf, off, val); }
+/// Store args to consecutive words from buf[0]; returns the word count.
+template<typename... Args>
+inline uint32_t write_words(float* buf, Args... args) {
+    uint32_t off = 0;
+    (store_word(buf, off++, args), ...);
+    return sizeof...(Args);
+}
 } // namespace detail
 
 /// Write Circle (9 words). Returns word count.
 inline uint32_t writeCircle(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 0u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 0u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Box (10 words). Returns word count.
 inline uint32_t writeBox(float* buf, uint32_t layer, float cx, float cy, float hw, float hh, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 1u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = hw;
-    buf[5] = hh;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 1u, layer, cx, cy, hw, hh, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Segment (10 words). Returns word count.
 inline uint32_t writeSegment(float* buf, uint32_t layer, float x0, float y0, float x1, float y1, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 2u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = x0;
-    buf[3] = y0;
-    buf[4] = x1;
-    buf[5] = y1;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 2u, layer, x0, y0, x1, y1, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Triangle (12 words). Returns word count.
 inline uint32_t writeTriangle(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float vx, float vy, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 3u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = vx;
-    buf[7] = vy;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 3u, layer, ax, ay, bx, by, vx, vy, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Bezier2 (12 words). Returns word count.
 inline uint32_t writeBezier2(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float cx, float cy, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 4u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = cx;
-    buf[7] = cy;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 4u, layer, ax, ay, bx, by, cx, cy, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Bezier3 (14 words). Returns word count.
 inline uint32_t writeBezier3(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float cx, float cy, float dx, float dy, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 5u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = cx;
-    buf[7] = cy;
-    buf[8] = dx;
-    buf[9] = dy;
-    detail::write_u32(buf, 10, fillColor);
-    detail::write_u32(buf, 11, strokeColor);
-    buf[12] = strokeWidth;
-    buf[13] = round_;
-    return 14;
+    return detail::write_words(buf, 5u, layer, ax, ay, bx, by, cx, cy, dx, dy, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Ellipse (10 words). Returns word count.
 inline uint32_t writeEllipse(float* buf, uint32_t layer, float cx, float cy, float rx, float ry, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 6u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = rx;
-    buf[5] = ry;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 6u, layer, cx, cy, rx, ry, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Arc (12 words). Returns word count.
 inline uint32_t writeArc(float* buf, uint32_t layer, float cx, float cy, float sc_x, float sc_y, float ra, float rb, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 7u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = sc_x;
-    buf[5] = sc_y;
-    buf[6] = ra;
-    buf[7] = rb;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 7u, layer, cx, cy, sc_x, sc_y, ra, rb, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write RoundedBox (14 words). Returns word count.
 inline uint32_t writeRoundedBox(float* buf, uint32_t layer, float cx, float cy, float hw, float hh, float r0, float r1, float r2, float r3, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 8u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = hw;
-    buf[5] = hh;
-    buf[6] = r0;
-    buf[7] = r1;
-    buf[8] = r2;
-    buf[9] = r3;
-    detail::write_u32(buf, 10, fillColor);
-    detail::write_u32(buf, 11, strokeColor);
-    buf[12] = strokeWidth;
-    buf[13] = round_;
-    return 14;
+    return detail::write_words(buf, 8u, layer, cx, cy, hw, hh, r0, r1, r2, r3, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Rhombus (10 words). Returns word count.
 inline uint32_t writeRhombus(float* buf, uint32_t layer, float cx, float cy, float bx, float by, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 9u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = bx;
-    buf[5] = by;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 9u, layer, cx, cy, bx, by, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Pentagon (9 words). Returns word count.
 inline uint32_t writePentagon(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 10u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 10u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Hexagon (9 words). Returns word count.
 inline uint32_t writeHexagon(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 11u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 11u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Star (11 words). Returns word count.
 inline uint32_t writeStar(float* buf, uint32_t layer, float cx, float cy, float r, float n, float m, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 12u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    buf[5] = n;
-    buf[6] = m;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 12u, layer, cx, cy, r, n, m, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Pie (11 words). Returns word count.
 inline uint32_t writePie(float* buf, uint32_t layer, float cx, float cy, float sc_x, float sc_y, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 13u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = sc_x;
-    buf[5] = sc_y;
-    buf[6] = r;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 13u, layer, cx, cy, sc_x, sc_y, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Ring (12 words). Returns word count.
 inline uint32_t writeRing(float* buf, uint32_t layer, float cx, float cy, float nx, float ny, float r, float th, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 14u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = nx;
-    buf[5] = ny;
-    buf[6] = r;
-    buf[7] = th;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 14u, layer, cx, cy, nx, ny, r, th, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Heart (9 words). Returns word count.
 inline uint32_t writeHeart(float* buf, uint32_t layer, float cx, float cy, float scale, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 15u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = scale;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 15u, layer, cx, cy, scale, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Cross (11 words). Returns word count.
 inline uint32_t writeCross(float* buf, uint32_t layer, float cx, float cy, float bx, float by, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 16u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = r;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 16u, layer, cx, cy, bx, by, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write RoundedX (10 words). Returns word count.
 inline uint32_t writeRoundedX(float* buf, uint32_t layer, float cx, float cy, float w, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 17u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = w;
-    buf[5] = r;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 17u, layer, cx, cy, w, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Capsule (11 words). Returns word count.
 inline uint32_t writeCapsule(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 18u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = r;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 18u, layer, ax, ay, bx, by, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Moon (11 words). Returns word count.
 inline uint32_t writeMoon(float* buf, uint32_t layer, float cx, float cy, float d, float ra, float rb, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 19u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = d;
-    buf[5] = ra;
-    buf[6] = rb;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 19u, layer, cx, cy, d, ra, rb, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Egg (10 words). Returns word count.
 inline uint32_t writeEgg(float* buf, uint32_t layer, float cx, float cy, float ra, float rb, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 20u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = ra;
-    buf[5] = rb;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 20u, layer, cx, cy, ra, rb, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write ChamferBox (11 words). Returns word count.
 inline uint32_t writeChamferBox(float* buf, uint32_t layer, float cx, float cy, float hw, float hh, float chamfer, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 21u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = hw;
-    buf[5] = hh;
-    buf[6] = chamfer;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 21u, layer, cx, cy, hw, hh, chamfer, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write OrientedBox (11 words). Returns word count.
 inline uint32_t writeOrientedBox(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float th, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 22u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = th;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 22u, layer, ax, ay, bx, by, th, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Trapezoid (11 words). Returns word count.
 inline uint32_t writeTrapezoid(float* buf, uint32_t layer, float cx, float cy, float r1, float r2, float he, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 23u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r1;
-    buf[5] = r2;
-    buf[6] = he;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 23u, layer, cx, cy, r1, r2, he, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Parallelogram (11 words). Returns word count.
 inline uint32_t writeParallelogram(float* buf, uint32_t layer, float cx, float cy, float wi, float he, float sk, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 24u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = wi;
-    buf[5] = he;
-    buf[6] = sk;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 24u, layer, cx, cy, wi, he, sk, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write EquilateralTriangle (9 words). Returns word count.
 inline uint32_t writeEquilateralTriangle(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 25u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 25u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write IsoscelesTriangle (10 words). Returns word count.
 inline uint32_t writeIsoscelesTriangle(float* buf, uint32_t layer, float cx, float cy, float qx, float qy, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 26u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = qx;
-    buf[5] = qy;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 26u, layer, cx, cy, qx, qy, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write UnevenCapsule (11 words). Returns word count.
 inline uint32_t writeUnevenCapsule(float* buf, uint32_t layer, float cx, float cy, float r1, float r2, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 27u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r1;
-    buf[5] = r2;
-    buf[6] = h;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 27u, layer, cx, cy, r1, r2, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Octogon (9 words). Returns word count.
 inline uint32_t writeOctogon(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 28u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 28u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Hexagram (9 words). Returns word count.
 inline uint32_t writeHexagram(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 29u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 29u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Pentagram (9 words). Returns word count.
 inline uint32_t writePentagram(float* buf, uint32_t layer, float cx, float cy, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 30u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 30u, layer, cx, cy, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write CutDisk (10 words). Returns word count.
 inline uint32_t writeCutDisk(float* buf, uint32_t layer, float cx, float cy, float r, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 31u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    buf[5] = h;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 31u, layer, cx, cy, r, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Horseshoe (13 words). Returns word count.
 inline uint32_t writeHorseshoe(float* buf, uint32_t layer, float cx, float cy, float sc_x, float sc_y, float r, float wx, float wy, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 32u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = sc_x;
-    buf[5] = sc_y;
-    buf[6] = r;
-    buf[7] = wx;
-    buf[8] = wy;
-    detail::write_u32(buf, 9, fillColor);
-    detail::write_u32(buf, 10, strokeColor);
-    buf[11] = strokeWidth;
-    buf[12] = round_;
-    return 13;
+    return detail::write_words(buf, 32u, layer, cx, cy, sc_x, sc_y, r, wx, wy, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Vesica (10 words). Returns word count.
 inline uint32_t writeVesica(float* buf, uint32_t layer, float cx, float cy, float w, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 33u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = w;
-    buf[5] = h;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 33u, layer, cx, cy, w, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write OrientedVesica (11 words). Returns word count.
 inline uint32_t writeOrientedVesica(float* buf, uint32_t layer, float ax, float ay, float bx, float by, float w, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 34u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = ax;
-    buf[3] = ay;
-    buf[4] = bx;
-    buf[5] = by;
-    buf[6] = w;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 34u, layer, ax, ay, bx, by, w, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write RoundedCross (9 words). Returns word count.
 inline uint32_t writeRoundedCross(float* buf, uint32_t layer, float cx, float cy, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 35u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = h;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 35u, layer, cx, cy, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Parabola (9 words). Returns word count.
 inline uint32_t writeParabola(float* buf, uint32_t layer, float cx, float cy, float k, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 36u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = k;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 36u, layer, cx, cy, k, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write BlobbyCross (9 words). Returns word count.
 inline uint32_t writeBlobbyCross(float* buf, uint32_t layer, float cx, float cy, float he, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 37u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = he;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 37u, layer, cx, cy, he, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Tunnel (10 words). Returns word count.
 inline uint32_t writeTunnel(float* buf, uint32_t layer, float cx, float cy, float wh_x, float wh_y, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 38u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = wh_x;
-    buf[5] = wh_y;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 38u, layer, cx, cy, wh_x, wh_y, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Stairs (11 words). Returns word count.
 inline uint32_t writeStairs(float* buf, uint32_t layer, float cx, float cy, float wh_x, float wh_y, float n, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 39u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = wh_x;
-    buf[5] = wh_y;
-    buf[6] = n;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 39u, layer, cx, cy, wh_x, wh_y, n, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write QuadraticCircle (9 words). Returns word count.
 inline uint32_t writeQuadraticCircle(float* buf, uint32_t layer, float cx, float cy, float scale, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 40u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = scale;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 40u, layer, cx, cy, scale, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Hyperbola (10 words). Returns word count.
 inline uint32_t writeHyperbola(float* buf, uint32_t layer, float cx, float cy, float k, float he, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 41u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = k;
-    buf[5] = he;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 41u, layer, cx, cy, k, he, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write CoolS (9 words). Returns word count.
 inline uint32_t writeCoolS(float* buf, uint32_t layer, float cx, float cy, float scale, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 42u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = scale;
-    detail::write_u32(buf, 5, fillColor);
-    detail::write_u32(buf, 6, strokeColor);
-    buf[7] = strokeWidth;
-    buf[8] = round_;
-    return 9;
+    return detail::write_words(buf, 42u, layer, cx, cy, scale, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write CircleWave (10 words). Returns word count.
 inline uint32_t writeCircleWave(float* buf, uint32_t layer, float cx, float cy, float tb, float ra, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 43u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = tb;
-    buf[5] = ra;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 43u, layer, cx, cy, tb, ra, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write ColorWheel (14 words). Returns word count.
 inline uint32_t writeColorWheel(float* buf, uint32_t layer, float cx, float cy, float outerR, float innerR, float hue, float sat, float val, float indicatorSize, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 44u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = outerR;
-    buf[5] = innerR;
-    buf[6] = hue;
-    buf[7] = sat;
-    buf[8] = val;
-    buf[9] = indicatorSize;
-    detail::write_u32(buf, 10, fillColor);
-    detail::write_u32(buf, 11, strokeColor);
-    buf[12] = strokeWidth;
-    buf[13] = round_;
-    return 14;
+    return detail::write_words(buf, 44u, layer, cx, cy, outerR, innerR, hue, sat, val, indicatorSize, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write TextGlyph (11 words). Returns word count.
 inline uint32_t writeTextGlyph(float* buf, uint32_t layer, float x, float y, float scaleX, float scaleY, uint32_t glyphIndex, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 64u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = x;
-    buf[3] = y;
-    buf[4] = scaleX;
-    buf[5] = scaleY;
-    detail::write_u32(buf, 6, glyphIndex);
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 64u, layer, x, y, scaleX, scaleY, glyphIndex, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write RotatedGlyph (14 words). Returns word count.
 inline uint32_t writeRotatedGlyph(float* buf, uint32_t layer, float x, float y, float scaleX, float scaleY, float angle, uint32_t glyphIndex, float cosAngle, float sinAngle, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 65u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = x;
-    buf[3] = y;
-    buf[4] = scaleX;
-    buf[5] = scaleY;
-    buf[6] = angle;
-    detail::write_u32(buf, 7, glyphIndex);
-    buf[8] = cosAngle;
-    buf[9] = sinAngle;
-    detail::write_u32(buf, 10, fillColor);
-    detail::write_u32(buf, 11, strokeColor);
-    buf[12] = strokeWidth;
-    buf[13] = round_;
-    return 14;
+    return detail::write_words(buf, 65u, layer, x, y, scaleX, scaleY, angle, glyphIndex, cosAngle, sinAngle, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Sphere3D (10 words). Returns word count.
 inline uint32_t writeSphere3D(float* buf, uint32_t layer, float px, float py, float pz, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 100u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = r;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 100u, layer, px, py, pz, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Box3D (12 words). Returns word count.
 inline uint32_t writeBox3D(float* buf, uint32_t layer, float px, float py, float pz, float bx, float by, float bz, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 101u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = bx;
-    buf[6] = by;
-    buf[7] = bz;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 101u, layer, px, py, pz, bx, by, bz, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Torus3D (11 words). Returns word count.
 inline uint32_t writeTorus3D(float* buf, uint32_t layer, float px, float py, float pz, float majorR, float minorR, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 103u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = majorR;
-    buf[6] = minorR;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 103u, layer, px, py, pz, majorR, minorR, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Cylinder3D (11 words). Returns word count.
 inline uint32_t writeCylinder3D(float* buf, uint32_t layer, float px, float py, float pz, float r, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 105u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = r;
-    buf[6] = h;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 105u, layer, px, py, pz, r, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write VerticalCapsule3D (11 words). Returns word count.
 inline uint32_t writeVerticalCapsule3D(float* buf, uint32_t layer, float px, float py, float pz, float h, float r, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 108u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = h;
-    buf[6] = r;
-    detail::write_u32(buf, 7, fillColor);
-    detail::write_u32(buf, 8, strokeColor);
-    buf[9] = strokeWidth;
-    buf[10] = round_;
-    return 11;
+    return detail::write_words(buf, 108u, layer, px, py, pz, h, r, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write CappedCone3D (12 words). Returns word count.
 inline uint32_t writeCappedCone3D(float* buf, uint32_t layer, float px, float py, float pz, float h, float r1, float r2, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 110u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = h;
-    buf[6] = r1;
-    buf[7] = r2;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 110u, layer, px, py, pz, h, r1, r2, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Octahedron3D (10 words). Returns word count.
 inline uint32_t writeOctahedron3D(float* buf, uint32_t layer, float px, float py, float pz, float s, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 115u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = s;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 115u, layer, px, py, pz, s, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Pyramid3D (10 words). Returns word count.
 inline uint32_t writePyramid3D(float* buf, uint32_t layer, float px, float py, float pz, float h, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 116u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = h;
-    detail::write_u32(buf, 6, fillColor);
-    detail::write_u32(buf, 7, strokeColor);
-    buf[8] = strokeWidth;
-    buf[9] = round_;
-    return 10;
+    return detail::write_words(buf, 116u, layer, px, py, pz, h, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Ellipsoid3D (12 words). Returns word count.
 inline uint32_t writeEllipsoid3D(float* buf, uint32_t layer, float px, float py, float pz, float rx, float ry, float rz, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 117u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = px;
-    buf[3] = py;
-    buf[4] = pz;
-    buf[5] = rx;
-    buf[6] = ry;
-    buf[7] = rz;
-    detail::write_u32(buf, 8, fillColor);
-    detail::write_u32(buf, 9, strokeColor);
-    buf[10] = strokeWidth;
-    buf[11] = round_;
-    return 12;
+    return detail::write_words(buf, 117u, layer, px, py, pz, rx, ry, rz, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write Plot (12 words). Returns word count.
 inline uint32_t writePlot(float* buf, uint32_t layer, float x, float y, float w, float h, uint32_t dataCount, float minVal, float maxVal, uint32_t flags, uint32_t lineColor, uint32_t bgColor) {
-    detail::write_u32(buf, 0, 128u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = x;
-    buf[3] = y;
-    buf[4] = w;
-    buf[5] = h;
-    detail::write_u32(buf, 6, dataCount);
-    buf[7] = minVal;
-    buf[8] = maxVal;
-    detail::write_u32(buf, 9, flags);
-    detail::write_u32(buf, 10, lineColor);
-    detail::write_u32(buf, 11, bgColor);
-    return 12;
+    return detail::write_words(buf, 128u, layer, x, y, w, h, dataCount, minVal, maxVal, flags, lineColor, bgColor);
 }
 
 /// Write Image (10 words). Returns word count.
 inline uint32_t writeImage(float* buf, uint32_t layer, float x, float y, float w, float h, uint32_t atlasX, uint32_t atlasY, uint32_t texW, uint32_t texH) {
-    detail::write_u32(buf, 0, 129u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = x;
-    buf[3] = y;
-    buf[4] = w;
-    buf[5] = h;
-    detail::write_u32(buf, 6, atlasX);
-    detail::write_u32(buf, 7, atlasY);
-    detail::write_u32(buf, 8, texW);
-    detail::write_u32(buf, 9, texH);
-    return 10;
+    return detail::write_words(buf, 129u, layer, x, y, w, h, atlasX, atlasY, texW, texH);
 }
 
 /// Write Polygon (7 words). Returns word count.
 inline uint32_t writePolygon(float* buf, uint32_t layer, uint32_t vertexCount, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 130u);
-    detail::write_u32(buf, 1, layer);
-    detail::write_u32(buf, 2, vertexCount);
-    detail::write_u32(buf, 3, fillColor);
-    detail::write_u32(buf, 4, strokeColor);
-    buf[5] = strokeWidth;
-    buf[6] = round_;
-    return 7;
+    return detail::write_words(buf, 130u, layer, vertexCount, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write PolygonGroup (8 words). Returns word count.
 inline uint32_t writePolygonGroup(float* buf, uint32_t layer, uint32_t vertexCount, uint32_t contourCount, uint32_t fillColor, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 131u);
-    detail::write_u32(buf, 1, layer);
-    detail::write_u32(buf, 2, vertexCount);
-    detail::write_u32(buf, 3, contourCount);
-    detail::write_u32(buf, 4, fillColor);
-    detail::write_u32(buf, 5, strokeColor);
-    buf[6] = strokeWidth;
-    buf[7] = round_;
-    return 8;
+    return detail::write_words(buf, 131u, layer, vertexCount, contourCount, fillColor, strokeColor, strokeWidth, round_);
 }
 
 /// Write LinearGradientBox (15 words). Returns word count.
 inline uint32_t writeLinearGradientBox(float* buf, uint32_t layer, float cx, float cy, float hw, float hh, float gx1, float gy1, float gx2, float gy2, uint32_t color1, uint32_t color2, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 132u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = hw;
-    buf[5] = hh;
-    buf[6] = gx1;
-    buf[7] = gy1;
-    buf[8] = gx2;
-    buf[9] = gy2;
-    detail::write_u32(buf, 10, color1);
-    detail::write_u32(buf, 11, color2);
-    detail::write_u32(buf, 12, strokeColor);
-    buf[13] = strokeWidth;
-    buf[14] = round_;
-    return 15;
+    return detail::write_words(buf, 132u, layer, cx, cy, hw, hh, gx1, gy1, gx2, gy2, color1, color2, strokeColor, strokeWidth, round_);
 }
 
 /// Write LinearGradientCircle (14 words). Returns word count.
 inline uint32_t writeLinearGradientCircle(float* buf, uint32_t layer, float cx, float cy, float r, float gx1, float gy1, float gx2, float gy2, uint32_t color1, uint32_t color2, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 133u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    buf[5] = gx1;
-    buf[6] = gy1;
-    buf[7] = gx2;
-    buf[8] = gy2;
-    detail::write_u32(buf, 9, color1);
-    detail::write_u32(buf, 10, color2);
-    detail::write_u32(buf, 11, strokeColor);
-    buf[12] = strokeWidth;
-    buf[13] = round_;
-    return 14;
+    return detail::write_words(buf, 133u, layer, cx, cy, r, gx1, gy1, gx2, gy2, color1, color2, strokeColor, strokeWidth, round_);
 }
 
 /// Write RadialGradientCircle (13 words). Returns word count.
 inline uint32_t writeRadialGradientCircle(float* buf, uint32_t layer, float cx, float cy, float r, float gcx, float gcy, float gr, uint32_t color1, uint32_t color2, uint32_t strokeColor, float strokeWidth, float round_) {
-    detail::write_u32(buf, 0, 134u);
-    detail::write_u32(buf, 1, layer);
-    buf[2] = cx;
-    buf[3] = cy;
-    buf[4] = r;
-    buf[5] = gcx;
-    buf[6] = gcy;
-    buf[7] = gr;
-    detail::write_u32(buf, 8, color1);
-    detail::write_u32(buf, 9, color2);
-    detail::write_u32(buf, 10, strokeColor);
-    buf[11] = strokeWidth;
-    buf[12] = round_;
-    return 13;
+    return detail::write_words(buf, 134u, layer, cx, cy, r, gcx, gcy, gr, color1, color2, strokeColor, strokeWidth, round_);
 }
 
 /// Return word count for a given SDF type ID. 0 = unknown.
 inline uint32_t wordCountForType(uint32_t type) {
-    switch (type) {
-    case 0u: return 9; // Circle
-    case 1u: return 10; // Box
-    case 2u: return 10; // Segment
-    case 3u: return 12; // Triangle
-    case 4u: return 12; // Bezier2
-    case 5u: return 14; // Bezier3
-    case 6u: return 10; // Ellipse
-    case 7u: return 12; // Arc
-    case 8u: return 14; // RoundedBox
-    case 9u: return 10; // Rhombus
-    case 10u: return 9; // Pentagon
-    case 11u: return 9; // Hexagon
-    case 12u: return 11; // Star
-    case 13u: return 11; // Pie
-    case 14u: return 12; // Ring
-    case 15u: return 9; // Heart
-    case 16u: return 11; // Cross
-    case 17u: return 10; // RoundedX
-    case 18u: return 11; // Capsule
-    case 19u: return 11; // Moon
-    case 20u: return 10; // Egg
-    case 21u: return 11; // ChamferBox
-    case 22u: return 11; // OrientedBox
-    case 23u: return 11; // Trapezoid
-    case 24u: return 11; // Parallelogram
-    case 25u: return 9; // EquilateralTriangle
-    case 26u: return 10; // IsoscelesTriangle
-    case 27u: return 11; // UnevenCapsule
-    case 28u: return 9; // Octogon
-    case 29u: return 9; // Hexagram
-    case 30u: return 9; // Pentagram
-    case 31u: return 10; // CutDisk
-    case 32u: return 13; // Horseshoe
-    case 33u: return 10; // Vesica
-    case 34u: return 11; // OrientedVesica
-    case 35u: return 9; // RoundedCross
-    case 36u: return 9; // Parabola
-    case 37u: return 9; // BlobbyCross
-    case 38u: return 10; // Tunnel
-    case 39u: return 11; // Stairs
-    case 40u: return 9; // QuadraticCircle
-    case 41u: return 10; // Hyperbola
-    case 42u: return 9; // CoolS
-    case 43u: return 10; // CircleWave
-    case 44u: return 14; // ColorWheel
-    case 64u: return 11; // TextGlyph
-    case 65u: return 14; // RotatedGlyph
-    case 100u: return 10; // Sphere3D
-    case 101u: return 12; // Box3D
-    case 103u: return 11; // Torus3D
-    case 105u: return 11; // Cylinder3D
-    case 108u: return 11; // VerticalCapsule3D
-    case 110u: return 12; // CappedCone3D
-    case 115u: return 10; // Octahedron3D
-    case 116u: return 10; // Pyramid3D
-    case 117u: return 12; // Ellipsoid3D
-    case 128u: return 12; // Plot
-    case 129u: return 10; // Image
-    case 130u: return 7; // Polygon
-    case 131u: return 8; // PolygonGroup
-    case 132u: return 15; // LinearGradientBox
-    case 133u: return 14; // LinearGradientCircle
-    case 134u: return 13; // RadialGradientCircle
-    default: return 0;
+    static constexpr uint32_t kWordCount[135] = {
+         9, 10, 10, 12, 12, 14, 10, 12, 14, 10,  9,  9, 11, 11, 12,  9, // 0..
+        11, 10, 11, 11, 10, 11, 11, 11, 11,  9, 10, 11,  9,  9,  9, 10, // 16..
+        13, 10, 11,  9,  9,  9, 10, 11,  9, 10,  9, 10, 14,  0,  0,  0, // 32..
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, // 48..
+        11, 14,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, // 64..
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, // 80..
+         0,  0,  0,  0, 10, 12,  0, 11,  0, 11,  0,  0, 11,  0, 12,  0, // 96..
+         0,  0,  0, 10, 10, 12,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, // 112..
+        12, 10,  7,  8, 15, 14, 13, // 128..
+    };
+    return type < 135u ? kWordCount[type] : 0u;
+}
+
+namespace detail {
+/// Translate grid[idx..end): glyph entries (high bit set) and indices
+/// >= numOffsets pass through unchanged.
+inline void translateCellEntries(
+        uint32_t* __restrict grid, uint32_t idx, uint32_t end,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    for (; idx < end; idx++) {
+        uint32_t rawVal = grid[idx];
+        if ((rawVal & 0x80000000u) != 0) continue;
+        if (rawVal < numOffsets) {
+            grid[idx] = wordOffsets[rawVal];
+        }
+    }
+}
+
+/// Scalar kernel. Requires numCells <= gridSize.
+inline void translateGridEntriesScalar(
+        uint32_t* __restrict grid, uint32_t gridSize, uint32_t numCells,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    for (uint32_t ci = 0; ci < numCells; ci++) {
+        uint32_t packedOff = grid[ci];
+        if (packedOff >= gridSize) continue;
+        uint32_t cnt = grid[packedOff];
+        uint32_t idx = packedOff + 1;
+        uint32_t end = (cnt < gridSize - idx) ? idx + cnt : gridSize;
+        translateCellEntries(grid, idx, end, wordOffsets, numOffsets);
+    }
+}
+
+#if YETTY_SDF_AVX2_DISPATCH
+/// AVX2 kernel, 8 entries at a time: glyph lanes and out-of-range indices
+/// are masked out of the gather; the cell tail goes through the scalar loop.
+/// Requires numCells <= gridSize and a CPU with AVX2.
+[[gnu::target("avx2")]] inline void translateGridEntriesAvx2(
+        uint32_t* __restrict grid, uint32_t gridSize, uint32_t numCells,
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    const int* offsetBase = reinterpret_cast<const int*>(wordOffsets);
+    const __m256i sizeVec = _mm256_set1_epi32(
+        static_cast<int>(numOffsets < 0x7fffffffu ? numOffsets : 0x7fffffffu));
+    for (uint32_t ci = 0; ci < numCells; ci++) {
+        uint32_t packedOff = grid[ci];
+        if (packedOff >= gridSize) continue;
+        uint32_t cnt = grid[packedOff];
+        uint32_t idx = packedOff + 1;
+        uint32_t end = (cnt < gridSize - idx) ? idx + cnt : gridSize;
+        for (; end - idx >= 8; idx += 8) {
+            __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(&grid[idx]));
+            __m256i isGlyph = _mm256_srai_epi32(v, 31);
+            __m256i inRange = _mm256_andnot_si256(isGlyph, _mm256_cmpgt_epi32(sizeVec, v));
+            v = _mm256_mask_i32gather_epi32(v, offsetBase, v, inRange, 4);
+            _mm256_storeu_si256(reinterpret_cast<__m256i*>(&grid[idx]), v);
+        }
+        translateCellEntries(grid, idx, end, wordOffsets, numOffsets);
     }
 }
+#endif
+} // namespace detail
 
 /// Translate grid entries from primitive indices to word offsets.
 /// Grid layout: [off0..offN-1][packed_cells...] where cell = [count][e0][e1]...
 /// Non-glyph entries (prim indices) are replaced with word offsets.
 inline void translateGridEntries(
-        uint32_t* grid, uint32_t gridSize,
+        uint32_t* __restrict grid, uint32_t gridSize,
         uint32_t gridW, uint32_t gridH,
-        const std::vector<uint32_t>& wordOffsets) {
-    if (wordOffsets.empty() || gridSize == 0) return;
+        const uint32_t* __restrict wordOffsets, uint32_t numOffsets) {
+    if (numOffsets == 0 || gridSize == 0) return;
     uint32_t numCells = gridW * gridH;
     if (numCells > gridSize) return;
-    for (uint32_t ci = 0; ci < numCells; ci++) {
-        uint32_t packedOff = grid[ci];
-        if (packedOff >= gridSize) continue;
-        uint32_t cnt = grid[packedOff];
-        for (uint32_t j = 0; j < cnt; j++) {
-            uint32_t idx = packedOff + 1 + j;
-            if (idx >= gridSize) break;
-            uint32_t rawVal = grid[idx];
-            if ((rawVal & 0x80000000u) != 0) continue;
-            if (rawVal < static_cast<uint32_t>(wordOffsets.size())) {
-                grid[idx] = wordOffsets[rawVal];
-            }
-        }
+#if YETTY_SDF_AVX2_DISPATCH
+    if (__builtin_cpu_supports("avx2")) {
+        detail::translateGridEntriesAvx2(grid, gridSize, numCells, wordOffsets, numOffsets);
+        return;
     }
+#endif
+    detail::translateGridEntriesScalar(grid, gridSize, numCells, wordOffsets, numOffsets);
+}
+
+/// Convenience overload for a std::vector of word offsets.
+inline void translateGridEntries(
+        uint32_t* grid, uint32_t gridSize,
+        uint32_t gridW, uint32_t gridH,
+        const std::vector<uint32_t>& wordOffsets) {
+    translateGridEntries(grid, gridSize, gridW, gridH,
+                         wordOffsets.data(), static_cast<uint32_t>(wordOffsets.size()));
 }
 
 #ifdef YETTY_CARD_SDF_PRIMITIVE_DEFINED
 
-/// Read buffer into SDFPrimitive. Returns words consumed (0 = unknown type).
-inline uint32_t readPrimitive(const float* buf, card::SDFPrimitive& prim) {
-    std::memset(&prim, 0, sizeof(prim));
-    uint32_t primType = detail::read_u32(buf, 0);
-    switch (static_cast<card::SDFType>(primType)) {
-    case card::SDFType::Circle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+namespace detail {
+inline constexpr bool kHeaderContiguous =
+    std::is_standard_layout_v<card::SDFPrimitive> &&
+    std::is_trivially_copyable_v<card::SDFPrimitive> &&
+    std::is_same_v<decltype(card::SDFPrimitive::type), uint32_t> &&
+    std::is_same_v<decltype(card::SDFPrimitive::layer), uint32_t> &&
+    offsetof(card::SDFPrimitive, layer) == offsetof(card::SDFPrimitive, type) + 1 * sizeof(float);
+inline constexpr bool kStyleContiguous =
+    std::is_standard_layout_v<card::SDFPrimitive> &&
+    std::is_trivially_copyable_v<card::SDFPrimitive> &&
+    std::is_same_v<decltype(card::SDFPrimitive::fillColor), uint32_t> &&
+    std::is_same_v<decltype(card::SDFPrimitive::strokeColor), uint32_t> &&
+    std::is_same_v<decltype(card::SDFPrimitive::strokeWidth), float> &&
+    std::is_same_v<decltype(card::SDFPrimitive::round), float> &&
+    offsetof(card::SDFPrimitive, strokeColor) == offsetof(card::SDFPrimitive, fillColor) + 1 * sizeof(float) &&
+    offsetof(card::SDFPrimitive, strokeWidth) == offsetof(card::SDFPrimitive, fillColor) + 2 * sizeof(float) &&
+    offsetof(card::SDFPrimitive, round) == offsetof(card::SDFPrimitive, fillColor) + 3 * sizeof(float);
+} // namespace detail
+
+/// Per-type codec. read() only sets the fields of that type's layout.
+template<card::SDFType T> struct PrimCodec;
+
+template<> struct PrimCodec<card::SDFType::Circle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::Box: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+};
+
+template<> struct PrimCodec<card::SDFType::Box> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
+        return 10;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Segment> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Segment: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Triangle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
+};
+
+template<> struct PrimCodec<card::SDFType::Triangle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
+        return 12;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
         return 12;
     }
-    case card::SDFType::Bezier2: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
+};
+
+template<> struct PrimCodec<card::SDFType::Bezier2> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
         return 12;
     }
-    case card::SDFType::Bezier3: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        prim.params[7] = buf[9];
-        prim.fillColor = detail::read_u32(buf, 10);
-        prim.strokeColor = detail::read_u32(buf, 11);
-        prim.strokeWidth = buf[12];
-        prim.round = buf[13];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
+        return 12;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Bezier3> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[10], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 10);
+            prim.strokeColor = detail::read_u32(buf, 11);
+            prim.strokeWidth = buf[12];
+            prim.round = buf[13];
+        }
+        return 14;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[10], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 10, prim.fillColor);
+            detail::write_u32(buf, 11, prim.strokeColor);
+            buf[12] = prim.strokeWidth;
+            buf[13] = prim.round;
+        }
         return 14;
     }
-    case card::SDFType::Ellipse: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+};
+
+template<> struct PrimCodec<card::SDFType::Ellipse> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Arc: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
+};
+
+template<> struct PrimCodec<card::SDFType::Arc> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
         return 12;
     }
-    case card::SDFType::RoundedBox: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        prim.params[7] = buf[9];
-        prim.fillColor = detail::read_u32(buf, 10);
-        prim.strokeColor = detail::read_u32(buf, 11);
-        prim.strokeWidth = buf[12];
-        prim.round = buf[13];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
+        return 12;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::RoundedBox> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[10], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 10);
+            prim.strokeColor = detail::read_u32(buf, 11);
+            prim.strokeWidth = buf[12];
+            prim.round = buf[13];
+        }
+        return 14;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[10], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 10, prim.fillColor);
+            detail::write_u32(buf, 11, prim.strokeColor);
+            buf[12] = prim.strokeWidth;
+            buf[13] = prim.round;
+        }
         return 14;
     }
-    case card::SDFType::Rhombus: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+};
+
+template<> struct PrimCodec<card::SDFType::Rhombus> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Pentagon: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+};
+
+template<> struct PrimCodec<card::SDFType::Pentagon> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Hexagon> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
         return 9;
     }
-    case card::SDFType::Hexagon: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::Star: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::Star> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Pie> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::Pie: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::Ring: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
+};
+
+template<> struct PrimCodec<card::SDFType::Ring> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
         return 12;
     }
-    case card::SDFType::Heart: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
+        return 12;
     }
-    case card::SDFType::Cross: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
-        return 11;
+};
+
+template<> struct PrimCodec<card::SDFType::Heart> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::RoundedX: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
     }
-    case card::SDFType::Capsule: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::Cross> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::Moon: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::Egg: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+};
+
+template<> struct PrimCodec<card::SDFType::RoundedX> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::ChamferBox: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::Capsule> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::OrientedBox: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::Trapezoid: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::Moon> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::Parallelogram: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::EquilateralTriangle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+};
+
+template<> struct PrimCodec<card::SDFType::Egg> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
     }
-    case card::SDFType::IsoscelesTriangle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::UnevenCapsule: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::ChamferBox> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::Octogon: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Hexagram: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+};
+
+template<> struct PrimCodec<card::SDFType::OrientedBox> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
     }
-    case card::SDFType::Pentagram: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::CutDisk: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+};
+
+template<> struct PrimCodec<card::SDFType::Trapezoid> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
     }
-    case card::SDFType::Horseshoe: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        prim.fillColor = detail::read_u32(buf, 9);
-        prim.strokeColor = detail::read_u32(buf, 10);
-        prim.strokeWidth = buf[11];
-        prim.round = buf[12];
-        return 13;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Vesica: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+};
+
+template<> struct PrimCodec<card::SDFType::Parallelogram> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
     }
-    case card::SDFType::OrientedVesica: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::RoundedCross: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+};
+
+template<> struct PrimCodec<card::SDFType::EquilateralTriangle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
         return 9;
     }
-    case card::SDFType::Parabola: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::BlobbyCross: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+};
+
+template<> struct PrimCodec<card::SDFType::IsoscelesTriangle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
     }
-    case card::SDFType::Tunnel: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Stairs: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
+};
+
+template<> struct PrimCodec<card::SDFType::UnevenCapsule> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::QuadraticCircle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Hyperbola: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+};
+
+template<> struct PrimCodec<card::SDFType::Octogon> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::CoolS: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.fillColor = detail::read_u32(buf, 5);
-        prim.strokeColor = detail::read_u32(buf, 6);
-        prim.strokeWidth = buf[7];
-        prim.round = buf[8];
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::CircleWave: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+};
+
+template<> struct PrimCodec<card::SDFType::Hexagram> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::ColorWheel: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        prim.params[7] = buf[9];
-        prim.fillColor = detail::read_u32(buf, 10);
-        prim.strokeColor = detail::read_u32(buf, 11);
-        prim.strokeWidth = buf[12];
-        prim.round = buf[13];
-        return 14;
-    }
-    case card::SDFType::TextGlyph: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        std::memcpy(&prim.params[4], &buf[6], sizeof(float));
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
-        return 11;
-    }
-    case card::SDFType::RotatedGlyph: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        std::memcpy(&prim.params[5], &buf[7], sizeof(float));
-        prim.params[6] = buf[8];
-        prim.params[7] = buf[9];
-        prim.fillColor = detail::read_u32(buf, 10);
-        prim.strokeColor = detail::read_u32(buf, 11);
-        prim.strokeWidth = buf[12];
-        prim.round = buf[13];
-        return 14;
-    }
-    case card::SDFType::Sphere3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
-    }
-    case card::SDFType::Box3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
-        return 12;
-    }
-    case card::SDFType::Torus3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
-        return 11;
-    }
-    case card::SDFType::Cylinder3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
-        return 11;
-    }
-    case card::SDFType::VerticalCapsule3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.fillColor = detail::read_u32(buf, 7);
-        prim.strokeColor = detail::read_u32(buf, 8);
-        prim.strokeWidth = buf[9];
-        prim.round = buf[10];
-        return 11;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
     }
-    case card::SDFType::CappedCone3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
-        return 12;
+};
+
+template<> struct PrimCodec<card::SDFType::Pentagram> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::Octahedron3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
-        return 10;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
     }
-    case card::SDFType::Pyramid3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.fillColor = detail::read_u32(buf, 6);
-        prim.strokeColor = detail::read_u32(buf, 7);
-        prim.strokeWidth = buf[8];
-        prim.round = buf[9];
+};
+
+template<> struct PrimCodec<card::SDFType::CutDisk> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Ellipsoid3D: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.fillColor = detail::read_u32(buf, 8);
-        prim.strokeColor = detail::read_u32(buf, 9);
-        prim.strokeWidth = buf[10];
-        prim.round = buf[11];
-        return 12;
-    }
-    case card::SDFType::Plot: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        std::memcpy(&prim.params[4], &buf[6], sizeof(float));
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        std::memcpy(&prim.params[7], &buf[9], sizeof(float));
-        std::memcpy(&prim.params[8], &buf[10], sizeof(float));
-        std::memcpy(&prim.params[9], &buf[11], sizeof(float));
-        return 12;
-    }
-    case card::SDFType::Image: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        std::memcpy(&prim.params[4], &buf[6], sizeof(float));
-        std::memcpy(&prim.params[5], &buf[7], sizeof(float));
-        std::memcpy(&prim.params[6], &buf[8], sizeof(float));
-        std::memcpy(&prim.params[7], &buf[9], sizeof(float));
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Polygon: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        std::memcpy(&prim.params[0], &buf[2], sizeof(float));
-        prim.fillColor = detail::read_u32(buf, 3);
-        prim.strokeColor = detail::read_u32(buf, 4);
-        prim.strokeWidth = buf[5];
-        prim.round = buf[6];
-        return 7;
-    }
-    case card::SDFType::PolygonGroup: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        std::memcpy(&prim.params[0], &buf[2], sizeof(float));
-        std::memcpy(&prim.params[1], &buf[3], sizeof(float));
-        prim.fillColor = detail::read_u32(buf, 4);
-        prim.strokeColor = detail::read_u32(buf, 5);
-        prim.strokeWidth = buf[6];
-        prim.round = buf[7];
-        return 8;
-    }
-    case card::SDFType::LinearGradientBox: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        prim.params[7] = buf[9];
-        std::memcpy(&prim.params[8], &buf[10], sizeof(float));
-        std::memcpy(&prim.params[9], &buf[11], sizeof(float));
-        prim.strokeColor = detail::read_u32(buf, 12);
-        prim.strokeWidth = buf[13];
-        prim.round = buf[14];
-        return 15;
-    }
-    case card::SDFType::LinearGradientCircle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        prim.params[6] = buf[8];
-        std::memcpy(&prim.params[7], &buf[9], sizeof(float));
-        std::memcpy(&prim.params[8], &buf[10], sizeof(float));
-        prim.strokeColor = detail::read_u32(buf, 11);
-        prim.strokeWidth = buf[12];
-        prim.round = buf[13];
-        return 14;
-    }
-    case card::SDFType::RadialGradientCircle: {
-        prim.type = detail::read_u32(buf, 0);
-        prim.layer = detail::read_u32(buf, 1);
-        prim.params[0] = buf[2];
-        prim.params[1] = buf[3];
-        prim.params[2] = buf[4];
-        prim.params[3] = buf[5];
-        prim.params[4] = buf[6];
-        prim.params[5] = buf[7];
-        std::memcpy(&prim.params[6], &buf[8], sizeof(float));
-        std::memcpy(&prim.params[7], &buf[9], sizeof(float));
-        prim.strokeColor = detail::read_u32(buf, 10);
-        prim.strokeWidth = buf[11];
-        prim.round = buf[12];
+};
+
+template<> struct PrimCodec<card::SDFType::Horseshoe> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 7 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[9], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 9);
+            prim.strokeColor = detail::read_u32(buf, 10);
+            prim.strokeWidth = buf[11];
+            prim.round = buf[12];
+        }
         return 13;
     }
-    default:
-        return 0;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 7 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[9], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 9, prim.fillColor);
+            detail::write_u32(buf, 10, prim.strokeColor);
+            buf[11] = prim.strokeWidth;
+            buf[12] = prim.round;
+        }
+        return 13;
     }
-}
+};
 
-/// Write SDFPrimitive to buffer. Returns word count (0 = unknown type).
-inline uint32_t writePrimitive(float* buf, const card::SDFPrimitive& prim) {
-    switch (static_cast<card::SDFType>(prim.type)) {
-    case card::SDFType::Circle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
-    }
-    case card::SDFType::Box: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
-        return 10;
-    }
-    case card::SDFType::Segment: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+template<> struct PrimCodec<card::SDFType::Vesica> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Triangle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
-        return 12;
-    }
-    case card::SDFType::Bezier2: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
-        return 12;
-    }
-    case card::SDFType::Bezier3: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        buf[9] = prim.params[7];
-        detail::write_u32(buf, 10, prim.fillColor);
-        detail::write_u32(buf, 11, prim.strokeColor);
-        buf[12] = prim.strokeWidth;
-        buf[13] = prim.round;
-        return 14;
-    }
-    case card::SDFType::Ellipse: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Arc: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
-        return 12;
-    }
-    case card::SDFType::RoundedBox: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        buf[9] = prim.params[7];
-        detail::write_u32(buf, 10, prim.fillColor);
-        detail::write_u32(buf, 11, prim.strokeColor);
-        buf[12] = prim.strokeWidth;
-        buf[13] = prim.round;
-        return 14;
+};
+
+template<> struct PrimCodec<card::SDFType::OrientedVesica> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
     }
-    case card::SDFType::Rhombus: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
-        return 10;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Pentagon: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::RoundedCross> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
         return 9;
     }
-    case card::SDFType::Hexagon: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::Star: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
-    }
-    case card::SDFType::Pie: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
+};
+
+template<> struct PrimCodec<card::SDFType::Parabola> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::Ring: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
-        return 12;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
     }
-    case card::SDFType::Heart: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::BlobbyCross> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
         return 9;
     }
-    case card::SDFType::Cross: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
+        return 9;
     }
-    case card::SDFType::RoundedX: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Tunnel> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Capsule: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
-    }
-    case card::SDFType::Moon: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
-    }
-    case card::SDFType::Egg: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::ChamferBox: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
-    }
-    case card::SDFType::OrientedBox: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Stairs> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::Trapezoid: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::Parallelogram: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
+};
+
+template<> struct PrimCodec<card::SDFType::QuadraticCircle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
+        return 9;
     }
-    case card::SDFType::EquilateralTriangle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::IsoscelesTriangle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Hyperbola> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::UnevenCapsule: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
+        return 10;
     }
-    case card::SDFType::Octogon: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::CoolS> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[5], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 5);
+            prim.strokeColor = detail::read_u32(buf, 6);
+            prim.strokeWidth = buf[7];
+            prim.round = buf[8];
+        }
         return 9;
     }
-    case card::SDFType::Hexagram: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 3 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[5], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 5, prim.fillColor);
+            detail::write_u32(buf, 6, prim.strokeColor);
+            buf[7] = prim.strokeWidth;
+            buf[8] = prim.round;
+        }
         return 9;
     }
-    case card::SDFType::Pentagram: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
+};
+
+template<> struct PrimCodec<card::SDFType::CircleWave> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
     }
-    case card::SDFType::CutDisk: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Horseshoe: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        detail::write_u32(buf, 9, prim.fillColor);
-        detail::write_u32(buf, 10, prim.strokeColor);
-        buf[11] = prim.strokeWidth;
-        buf[12] = prim.round;
-        return 13;
+};
+
+template<> struct PrimCodec<card::SDFType::ColorWheel> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[10], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 10);
+            prim.strokeColor = detail::read_u32(buf, 11);
+            prim.strokeWidth = buf[12];
+            prim.round = buf[13];
+        }
+        return 14;
     }
-    case card::SDFType::Vesica: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
-        return 10;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[10], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 10, prim.fillColor);
+            detail::write_u32(buf, 11, prim.strokeColor);
+            buf[12] = prim.strokeWidth;
+            buf[13] = prim.round;
+        }
+        return 14;
     }
-    case card::SDFType::OrientedVesica: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::TextGlyph> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::RoundedCross: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Parabola: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
+};
+
+template<> struct PrimCodec<card::SDFType::RotatedGlyph> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[10], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 10);
+            prim.strokeColor = detail::read_u32(buf, 11);
+            prim.strokeWidth = buf[12];
+            prim.round = buf[13];
+        }
+        return 14;
     }
-    case card::SDFType::BlobbyCross: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[10], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 10, prim.fillColor);
+            detail::write_u32(buf, 11, prim.strokeColor);
+            buf[12] = prim.strokeWidth;
+            buf[13] = prim.round;
+        }
+        return 14;
     }
-    case card::SDFType::Tunnel: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Sphere3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Stairs: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
-        return 11;
-    }
-    case card::SDFType::QuadraticCircle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
-    }
-    case card::SDFType::Hyperbola: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::CoolS: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        detail::write_u32(buf, 5, prim.fillColor);
-        detail::write_u32(buf, 6, prim.strokeColor);
-        buf[7] = prim.strokeWidth;
-        buf[8] = prim.round;
-        return 9;
-    }
-    case card::SDFType::CircleWave: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
-        return 10;
+};
+
+template<> struct PrimCodec<card::SDFType::Box3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
+        return 12;
     }
-    case card::SDFType::ColorWheel: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        buf[9] = prim.params[7];
-        detail::write_u32(buf, 10, prim.fillColor);
-        detail::write_u32(buf, 11, prim.strokeColor);
-        buf[12] = prim.strokeWidth;
-        buf[13] = prim.round;
-        return 14;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
+        return 12;
     }
-    case card::SDFType::TextGlyph: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        std::memcpy(&buf[6], &prim.params[4], sizeof(float));
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Torus3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::RotatedGlyph: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        std::memcpy(&buf[7], &prim.params[5], sizeof(float));
-        buf[8] = prim.params[6];
-        buf[9] = prim.params[7];
-        detail::write_u32(buf, 10, prim.fillColor);
-        detail::write_u32(buf, 11, prim.strokeColor);
-        buf[12] = prim.strokeWidth;
-        buf[13] = prim.round;
-        return 14;
-    }
-    case card::SDFType::Sphere3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
-        return 10;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
+        return 11;
     }
-    case card::SDFType::Box3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
-        return 12;
+};
+
+template<> struct PrimCodec<card::SDFType::Cylinder3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
+        return 11;
     }
-    case card::SDFType::Torus3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::Cylinder3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::VerticalCapsule3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[7], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 7);
+            prim.strokeColor = detail::read_u32(buf, 8);
+            prim.strokeWidth = buf[9];
+            prim.round = buf[10];
+        }
         return 11;
     }
-    case card::SDFType::VerticalCapsule3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        detail::write_u32(buf, 7, prim.fillColor);
-        detail::write_u32(buf, 8, prim.strokeColor);
-        buf[9] = prim.strokeWidth;
-        buf[10] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 5 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[7], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 7, prim.fillColor);
+            detail::write_u32(buf, 8, prim.strokeColor);
+            buf[9] = prim.strokeWidth;
+            buf[10] = prim.round;
+        }
         return 11;
     }
-    case card::SDFType::CappedCone3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::CappedCone3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
+        return 12;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
         return 12;
     }
-    case card::SDFType::Octahedron3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Octahedron3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
         return 10;
     }
-    case card::SDFType::Pyramid3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        detail::write_u32(buf, 6, prim.fillColor);
-        detail::write_u32(buf, 7, prim.strokeColor);
-        buf[8] = prim.strokeWidth;
-        buf[9] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
         return 10;
     }
-    case card::SDFType::Ellipsoid3D: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        detail::write_u32(buf, 8, prim.fillColor);
-        detail::write_u32(buf, 9, prim.strokeColor);
-        buf[10] = prim.strokeWidth;
-        buf[11] = prim.round;
+};
+
+template<> struct PrimCodec<card::SDFType::Pyramid3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[6], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 6);
+            prim.strokeColor = detail::read_u32(buf, 7);
+            prim.strokeWidth = buf[8];
+            prim.round = buf[9];
+        }
+        return 10;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 4 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[6], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 6, prim.fillColor);
+            detail::write_u32(buf, 7, prim.strokeColor);
+            buf[8] = prim.strokeWidth;
+            buf[9] = prim.round;
+        }
+        return 10;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Ellipsoid3D> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[8], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 8);
+            prim.strokeColor = detail::read_u32(buf, 9);
+            prim.strokeWidth = buf[10];
+            prim.round = buf[11];
+        }
+        return 12;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 6 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[8], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 8, prim.fillColor);
+            detail::write_u32(buf, 9, prim.strokeColor);
+            buf[10] = prim.strokeWidth;
+            buf[11] = prim.round;
+        }
+        return 12;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Plot> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 10 * sizeof(float));
         return 12;
     }
-    case card::SDFType::Plot: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        std::memcpy(&buf[6], &prim.params[4], sizeof(float));
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        std::memcpy(&buf[9], &prim.params[7], sizeof(float));
-        std::memcpy(&buf[10], &prim.params[8], sizeof(float));
-        std::memcpy(&buf[11], &prim.params[9], sizeof(float));
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 10 * sizeof(float));
         return 12;
     }
-    case card::SDFType::Image: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        std::memcpy(&buf[6], &prim.params[4], sizeof(float));
-        std::memcpy(&buf[7], &prim.params[5], sizeof(float));
-        std::memcpy(&buf[8], &prim.params[6], sizeof(float));
-        std::memcpy(&buf[9], &prim.params[7], sizeof(float));
+};
+
+template<> struct PrimCodec<card::SDFType::Image> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
         return 10;
     }
-    case card::SDFType::Polygon: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        std::memcpy(&buf[2], &prim.params[0], sizeof(float));
-        detail::write_u32(buf, 3, prim.fillColor);
-        detail::write_u32(buf, 4, prim.strokeColor);
-        buf[5] = prim.strokeWidth;
-        buf[6] = prim.round;
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
+        return 10;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::Polygon> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[3], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 3);
+            prim.strokeColor = detail::read_u32(buf, 4);
+            prim.strokeWidth = buf[5];
+            prim.round = buf[6];
+        }
         return 7;
     }
-    case card::SDFType::PolygonGroup: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
         std::memcpy(&buf[2], &prim.params[0], sizeof(float));
-        std::memcpy(&buf[3], &prim.params[1], sizeof(float));
-        detail::write_u32(buf, 4, prim.fillColor);
-        detail::write_u32(buf, 5, prim.strokeColor);
-        buf[6] = prim.strokeWidth;
-        buf[7] = prim.round;
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[3], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 3, prim.fillColor);
+            detail::write_u32(buf, 4, prim.strokeColor);
+            buf[5] = prim.strokeWidth;
+            buf[6] = prim.round;
+        }
+        return 7;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::PolygonGroup> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 2 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), &buf[4], 4 * sizeof(float));
+        } else {
+            prim.fillColor = detail::read_u32(buf, 4);
+            prim.strokeColor = detail::read_u32(buf, 5);
+            prim.strokeWidth = buf[6];
+            prim.round = buf[7];
+        }
         return 8;
     }
-    case card::SDFType::LinearGradientBox: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        buf[9] = prim.params[7];
-        std::memcpy(&buf[10], &prim.params[8], sizeof(float));
-        std::memcpy(&buf[11], &prim.params[9], sizeof(float));
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 2 * sizeof(float));
+        if constexpr (detail::kStyleContiguous) {
+            std::memcpy(&buf[4], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, fillColor), 4 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 4, prim.fillColor);
+            detail::write_u32(buf, 5, prim.strokeColor);
+            buf[6] = prim.strokeWidth;
+            buf[7] = prim.round;
+        }
+        return 8;
+    }
+};
+
+template<> struct PrimCodec<card::SDFType::LinearGradientBox> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 10 * sizeof(float));
+        prim.strokeColor = detail::read_u32(buf, 12);
+        prim.strokeWidth = buf[13];
+        prim.round = buf[14];
+        return 15;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 10 * sizeof(float));
         detail::write_u32(buf, 12, prim.strokeColor);
         buf[13] = prim.strokeWidth;
         buf[14] = prim.round;
         return 15;
     }
-    case card::SDFType::LinearGradientCircle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        buf[8] = prim.params[6];
-        std::memcpy(&buf[9], &prim.params[7], sizeof(float));
-        std::memcpy(&buf[10], &prim.params[8], sizeof(float));
+};
+
+template<> struct PrimCodec<card::SDFType::LinearGradientCircle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 9 * sizeof(float));
+        prim.strokeColor = detail::read_u32(buf, 11);
+        prim.strokeWidth = buf[12];
+        prim.round = buf[13];
+        return 14;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 9 * sizeof(float));
         detail::write_u32(buf, 11, prim.strokeColor);
         buf[12] = prim.strokeWidth;
         buf[13] = prim.round;
         return 14;
     }
-    case card::SDFType::RadialGradientCircle: {
-        detail::write_u32(buf, 0, prim.type);
-        detail::write_u32(buf, 1, prim.layer);
-        buf[2] = prim.params[0];
-        buf[3] = prim.params[1];
-        buf[4] = prim.params[2];
-        buf[5] = prim.params[3];
-        buf[6] = prim.params[4];
-        buf[7] = prim.params[5];
-        std::memcpy(&buf[8], &prim.params[6], sizeof(float));
-        std::memcpy(&buf[9], &prim.params[7], sizeof(float));
+};
+
+template<> struct PrimCodec<card::SDFType::RadialGradientCircle> {
+    static inline uint32_t read(const float* buf, card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(reinterpret_cast<char*>(&prim) + offsetof(card::SDFPrimitive, type), &buf[0], 2 * sizeof(float));
+        } else {
+            prim.type = detail::read_u32(buf, 0);
+            prim.layer = detail::read_u32(buf, 1);
+        }
+        std::memcpy(&prim.params[0], &buf[2], 8 * sizeof(float));
+        prim.strokeColor = detail::read_u32(buf, 10);
+        prim.strokeWidth = buf[11];
+        prim.round = buf[12];
+        return 13;
+    }
+    static inline uint32_t write(float* buf, const card::SDFPrimitive& prim) {
+        if constexpr (detail::kHeaderContiguous) {
+            std::memcpy(&buf[0], reinterpret_cast<const char*>(&prim) + offsetof(card::SDFPrimitive, type), 2 * sizeof(float));
+        } else {
+            detail::write_u32(buf, 0, prim.type);
+            detail::write_u32(buf, 1, prim.layer);
+        }
+        std::memcpy(&buf[2], &prim.params[0], 8 * sizeof(float));
         detail::write_u32(buf, 10, prim.strokeColor);
         buf[11] = prim.strokeWidth;
         buf[12] = prim.round;
         return 13;
     }
+};
+
+/// Read buffer into SDFPrimitive. Returns words consumed (0 = unknown type).
+inline uint32_t readPrimitive(const float* buf, card::SDFPrimitive& prim) {
+    std::memset(&prim, 0, sizeof(prim));
+    uint32_t primType = detail::read_u32(buf, 0);
+    switch (static_cast<card::SDFType>(primType)) {
+    case card::SDFType::Circle: return PrimCodec<card::SDFType::Circle>::read(buf, prim);
+    case card::SDFType::Box: return PrimCodec<card::SDFType::Box>::read(buf, prim);
+    case card::SDFType::Segment: return PrimCodec<card::SDFType::Segment>::read(buf, prim);
+    case card::SDFType::Triangle: return PrimCodec<card::SDFType::Triangle>::read(buf, prim);
+    case card::SDFType::Bezier2: return PrimCodec<card::SDFType::Bezier2>::read(buf, prim);
+    case card::SDFType::Bezier3: return PrimCodec<card::SDFType::Bezier3>::read(buf, prim);
+    case card::SDFType::Ellipse: return PrimCodec<card::SDFType::Ellipse>::read(buf, prim);
+    case card::SDFType::Arc: return PrimCodec<card::SDFType::Arc>::read(buf, prim);
+    case card::SDFType::RoundedBox: return PrimCodec<card::SDFType::RoundedBox>::read(buf, prim);
+    case card::SDFType::Rhombus: return PrimCodec<card::SDFType::Rhombus>::read(buf, prim);
+    case card::SDFType::Pentagon: return PrimCodec<card::SDFType::Pentagon>::read(buf, prim);
+    case card::SDFType::Hexagon: return PrimCodec<card::SDFType::Hexagon>::read(buf, prim);
+    case card::SDFType::Star: return PrimCodec<card::SDFType::Star>::read(buf, prim);
+    case card::SDFType::Pie: return PrimCodec<card::SDFType::Pie>::read(buf, prim);
+    case card::SDFType::Ring: return PrimCodec<card::SDFType::Ring>::read(buf, prim);
+    case card::SDFType::Heart: return PrimCodec<card::SDFType::Heart>::read(buf, prim);
+    case card::SDFType::Cross: return PrimCodec<card::SDFType::Cross>::read(buf, prim);
+    case card::SDFType::RoundedX: return PrimCodec<card::SDFType::RoundedX>::read(buf, prim);
+    case card::SDFType::Capsule: return PrimCodec<card::SDFType::Capsule>::read(buf, prim);
+    case card::SDFType::Moon: return PrimCodec<card::SDFType::Moon>::read(buf, prim);
+    case card::SDFType::Egg: return PrimCodec<card::SDFType::Egg>::read(buf, prim);
+    case card::SDFType::ChamferBox: return PrimCodec<card::SDFType::ChamferBox>::read(buf, prim);
+    case card::SDFType::OrientedBox: return PrimCodec<card::SDFType::OrientedBox>::read(buf, prim);
+    case card::SDFType::Trapezoid: return PrimCodec<card::SDFType::Trapezoid>::read(buf, prim);
+    case card::SDFType::Parallelogram: return PrimCodec<card::SDFType::Parallelogram>::read(buf, prim);
+    case card::SDFType::EquilateralTriangle: return PrimCodec<card::SDFType::EquilateralTriangle>::read(buf, prim);
+    case card::SDFType::IsoscelesTriangle: return PrimCodec<card::SDFType::IsoscelesTriangle>::read(buf, prim);
+    case card::SDFType::UnevenCapsule: return PrimCodec<card::SDFType::UnevenCapsule>::read(buf, prim);
+    case card::SDFType::Octogon: return PrimCodec<card::SDFType::Octogon>::read(buf, prim);
+    case card::SDFType::Hexagram: return PrimCodec<card::SDFType::Hexagram>::read(buf, prim);
+    case card::SDFType::Pentagram: return PrimCodec<card::SDFType::Pentagram>::read(buf, prim);
+    case card::SDFType::CutDisk: return PrimCodec<card::SDFType::CutDisk>::read(buf, prim);
+    case card::SDFType::Horseshoe: return PrimCodec<card::SDFType::Horseshoe>::read(buf, prim);
+    case card::SDFType::Vesica: return PrimCodec<card::SDFType::Vesica>::read(buf, prim);
+    case card::SDFType::OrientedVesica: return PrimCodec<card::SDFType::OrientedVesica>::read(buf, prim);
+    case card::SDFType::RoundedCross: return PrimCodec<card::SDFType::RoundedCross>::read(buf, prim);
+    case card::SDFType::Parabola: return PrimCodec<card::SDFType::Parabola>::read(buf, prim);
+    case card::SDFType::BlobbyCross: return PrimCodec<card::SDFType::BlobbyCross>::read(buf, prim);
+    case card::SDFType::Tunnel: return PrimCodec<card::SDFType::Tunnel>::read(buf, prim);
+    case card::SDFType::Stairs: return PrimCodec<card::SDFType::Stairs>::read(buf, prim);
+    case card::SDFType::QuadraticCircle: return PrimCodec<card::SDFType::QuadraticCircle>::read(buf, prim);
+    case card::SDFType::Hyperbola: return PrimCodec<card::SDFType::Hyperbola>::read(buf, prim);
+    case card::SDFType::CoolS: return PrimCodec<card::SDFType::CoolS>::read(buf, prim);
+    case card::SDFType::CircleWave: return PrimCodec<card::SDFType::CircleWave>::read(buf, prim);
+    case card::SDFType::ColorWheel: return PrimCodec<card::SDFType::ColorWheel>::read(buf, prim);
+    case card::SDFType::TextGlyph: return PrimCodec<card::SDFType::TextGlyph>::read(buf, prim);
+    case card::SDFType::RotatedGlyph: return PrimCodec<card::SDFType::RotatedGlyph>::read(buf, prim);
+    case card::SDFType::Sphere3D: return PrimCodec<card::SDFType::Sphere3D>::read(buf, prim);
+    case card::SDFType::Box3D: return PrimCodec<card::SDFType::Box3D>::read(buf, prim);
+    case card::SDFType::Torus3D: return PrimCodec<card::SDFType::Torus3D>::read(buf, prim);
+    case card::SDFType::Cylinder3D: return PrimCodec<card::SDFType::Cylinder3D>::read(buf, prim);
+    case card::SDFType::VerticalCapsule3D: return PrimCodec<card::SDFType::VerticalCapsule3D>::read(buf, prim);
+    case card::SDFType::CappedCone3D: return PrimCodec<card::SDFType::CappedCone3D>::read(buf, prim);
+    case card::SDFType::Octahedron3D: return PrimCodec<card::SDFType::Octahedron3D>::read(buf, prim);
+    case card::SDFType::Pyramid3D: return PrimCodec<card::SDFType::Pyramid3D>::read(buf, prim);
+    case card::SDFType::Ellipsoid3D: return PrimCodec<card::SDFType::Ellipsoid3D>::read(buf, prim);
+    case card::SDFType::Plot: return PrimCodec<card::SDFType::Plot>::read(buf, prim);
+    case card::SDFType::Image: return PrimCodec<card::SDFType::Image>::read(buf, prim);
+    case card::SDFType::Polygon: return PrimCodec<card::SDFType::Polygon>::read(buf, prim);
+    case card::SDFType::PolygonGroup: return PrimCodec<card::SDFType::PolygonGroup>::read(buf, prim);
+    case card::SDFType::LinearGradientBox: return PrimCodec<card::SDFType::LinearGradientBox>::read(buf, prim);
+    case card::SDFType::LinearGradientCircle: return PrimCodec<card::SDFType::LinearGradientCircle>::read(buf, prim);
+    case card::SDFType::RadialGradientCircle: return PrimCodec<card::SDFType::RadialGradientCircle>::read(buf, prim);
+    default:
+        return 0;
+    }
+}
+
+/// Write SDFPrimitive to buffer. Returns word count (0 = unknown type).
+inline uint32_t writePrimitive(float* buf, const card::SDFPrimitive& prim) {
+    switch (static_cast<card::SDFType>(prim.type)) {
+    case card::SDFType::Circle: return PrimCodec<card::SDFType::Circle>::write(buf, prim);
+    case card::SDFType::Box: return PrimCodec<card::SDFType::Box>::write(buf, prim);
+    case card::SDFType::Segment: return PrimCodec<card::SDFType::Segment>::write(buf, prim);
+    case card::SDFType::Triangle: return PrimCodec<card::SDFType::Triangle>::write(buf, prim);
+    case card::SDFType::Bezier2: return PrimCodec<card::SDFType::Bezier2>::write(buf, prim);
+    case card::SDFType::Bezier3: return PrimCodec<card::SDFType::Bezier3>::write(buf, prim);
+    case card::SDFType::Ellipse: return PrimCodec<card::SDFType::Ellipse>::write(buf, prim);
+    case card::SDFType::Arc: return PrimCodec<card::SDFType::Arc>::write(buf, prim);
+    case card::SDFType::RoundedBox: return PrimCodec<card::SDFType::RoundedBox>::write(buf, prim);
+    case card::SDFType::Rhombus: return PrimCodec<card::SDFType::Rhombus>::write(buf, prim);
+    case card::SDFType::Pentagon: return PrimCodec<card::SDFType::Pentagon>::write(buf, prim);
+    case card::SDFType::Hexagon: return PrimCodec<card::SDFType::Hexagon>::write(buf, prim);
+    case card::SDFType::Star: return PrimCodec<card::SDFType::Star>::write(buf, prim);
+    case card::SDFType::Pie: return PrimCodec<card::SDFType::Pie>::write(buf, prim);
+    case card::SDFType::Ring: return PrimCodec<card::SDFType::Ring>::write(buf, prim);
+    case card::SDFType::Heart: return PrimCodec<card::SDFType::Heart>::write(buf, prim);
+    case card::SDFType::Cross: return PrimCodec<card::SDFType::Cross>::write(buf, prim);
+    case card::SDFType::RoundedX: return PrimCodec<card::SDFType::RoundedX>::write(buf, prim);
+    case card::SDFType::Capsule: return PrimCodec<card::SDFType::Capsule>::write(buf, prim);
+    case card::SDFType::Moon: return PrimCodec<card::SDFType::Moon>::write(buf, prim);
+    case card::SDFType::Egg: return PrimCodec<card::SDFType::Egg>::write(buf, prim);
+    case card::SDFType::ChamferBox: return PrimCodec<card::SDFType::ChamferBox>::write(buf, prim);
+    case card::SDFType::OrientedBox: return PrimCodec<card::SDFType::OrientedBox>::write(buf, prim);
+    case card::SDFType::Trapezoid: return PrimCodec<card::SDFType::Trapezoid>::write(buf, prim);
+    case card::SDFType::Parallelogram: return PrimCodec<card::SDFType::Parallelogram>::write(buf, prim);
+    case card::SDFType::EquilateralTriangle: return PrimCodec<card::SDFType::EquilateralTriangle>::write(buf, prim);
+    case card::SDFType::IsoscelesTriangle: return PrimCodec<card::SDFType::IsoscelesTriangle>::write(buf, prim);
+    case card::SDFType::UnevenCapsule: return PrimCodec<card::SDFType::UnevenCapsule>::write(buf, prim);
+    case card::SDFType::Octogon: return PrimCodec<card::SDFType::Octogon>::write(buf, prim);
+    case card::SDFType::Hexagram: return PrimCodec<card::SDFType::Hexagram>::write(buf, prim);
+    case card::SDFType::Pentagram: return PrimCodec<card::SDFType::Pentagram>::write(buf, prim);
+    case card::SDFType::CutDisk: return PrimCodec<card::SDFType::CutDisk>::write(buf, prim);
+    case card::SDFType::Horseshoe: return PrimCodec<card::SDFType::Horseshoe>::write(buf, prim);
+    case card::SDFType::Vesica: return PrimCodec<card::SDFType::Vesica>::write(buf, prim);
+    case card::SDFType::OrientedVesica: return PrimCodec<card::SDFType::OrientedVesica>::write(buf, prim);
+    case card::SDFType::RoundedCross: return PrimCodec<card::SDFType::RoundedCross>::write(buf, prim);
+    case card::SDFType::Parabola: return PrimCodec<card::SDFType::Parabola>::write(buf, prim);
+    case card::SDFType::BlobbyCross: return PrimCodec<card::SDFType::BlobbyCross>::write(buf, prim);
+    case card::SDFType::Tunnel: return PrimCodec<card::SDFType::Tunnel>::write(buf, prim);
+    case card::SDFType::Stairs: return PrimCodec<card::SDFType::Stairs>::write(buf, prim);
+    case card::SDFType::QuadraticCircle: return PrimCodec<card::SDFType::QuadraticCircle>::write(buf, prim);
+    case card::SDFType::Hyperbola: return PrimCodec<card::SDFType::Hyperbola>::write(buf, prim);
+    case card::SDFType::CoolS: return PrimCodec<card::SDFType::CoolS>::write(buf, prim);
+    case card::SDFType::CircleWave: return PrimCodec<card::SDFType::CircleWave>::write(buf, prim);
+    case card::SDFType::ColorWheel: return PrimCodec<card::SDFType::ColorWheel>::write(buf, prim);
+    case card::SDFType::TextGlyph: return PrimCodec<card::SDFType::TextGlyph>::write(buf, prim);
+    case card::SDFType::RotatedGlyph: return PrimCodec<card::SDFType::RotatedGlyph>::write(buf, prim);
+    case card::SDFType::Sphere3D: return PrimCodec<card::SDFType::Sphere3D>::write(buf, prim);
+    case card::SDFType::Box3D: return PrimCodec<card::SDFType::Box3D>::write(buf, prim);
+    case card::SDFType::Torus3D: return PrimCodec<card::SDFType::Torus3D>::write(buf, prim);
+    case card::SDFType::Cylinder3D: return PrimCodec<card::SDFType::Cylinder3D>::write(buf, prim);
+    case card::SDFType::VerticalCapsule3D: return PrimCodec<card::SDFType::VerticalCapsule3D>::write(buf, prim);
+    case card::SDFType::CappedCone3D: return PrimCodec<card::SDFType::CappedCone3D>::write(buf, prim);
+    case card::SDFType::Octahedron3D: return PrimCodec<card::SDFType::Octahedron3D>::write(buf, prim);
+    case card::SDFType::Pyramid3D: return PrimCodec<card::SDFType::Pyramid3D>::write(buf, prim);
+    case card::SDFType::Ellipsoid3D: return PrimCodec<card::SDFType::Ellipsoid3D>::write(buf, prim);
+    case card::SDFType::Plot: return PrimCodec<card::SDFType::Plot>::write(buf, prim);
+    case card::SDFType::Image: return PrimCodec<card::SDFType::Image>::write(buf, prim);
+    case card::SDFType::Polygon: return PrimCodec<card::SDFType::Polygon>::write(buf, prim);
+    case card::SDFType::PolygonGroup: return PrimCodec<card::SDFType::PolygonGroup>::write(buf, prim);
+    case card::SDFType::LinearGradientBox: return PrimCodec<card::SDFType::LinearGradientBox>::write(buf, prim);
+    case card::SDFType::LinearGradientCircle: return PrimCodec<card::SDFType::LinearGradientCircle>::write(buf, prim);
+    case card::SDFType::RadialGradientCircle: return PrimCodec<card::SDFType::RadialGradientCircle>::write(buf, prim);
     default:
         return 0;
     }
@@ -2861,9 +3036,8 @@ inline uint32_t writePrimitive(float* buf, const card::SDFPrimitive& prim) {
 inline uint32_t computeCompactSize(
         const card::SDFPrimitive* prims, uint32_t count) {
     uint32_t dataWords = 0;
-    float tmp[24];
     for (uint32_t i = 0; i < count; i++) {
-        uint32_t wc = writePrimitive(tmp, prims[i]);
+        uint32_t wc = wordCountForType(prims[i].type);
         dataWords += (wc > 0) ? wc : 1;
     }
     return (count + dataWords) * sizeof(float);
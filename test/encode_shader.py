@@ -12,49 +12,40 @@ Where:
 - base64_payload: file content encoded in base64
 """
 
+import argparse
+import base64
 import sys
 import os
 
-def base64_encode(data: bytes) -> str:
-    """Encode bytes to base64."""
-    import base64
-    return base64.b64encode(data).decode('ascii')
+# Multiple of 3, so per-chunk base64 output concatenates without padding
+CHUNK_SIZE = 3 * 16384
 
-def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <file> [options]", file=sys.stderr)
-        print("Options:", file=sys.stderr)
-        print("  --plugin=X  Plugin name: shader, image. Default: auto-detect", file=sys.stderr)
-        print("  --raw       Output only the base64 encoded string (no OSC wrapper)", file=sys.stderr)
-        print("  --mode=X    Position mode: A (absolute) or R (relative). Default: R", file=sys.stderr)
-        print("  --x=N       X position in cells. Default: 0", file=sys.stderr)
-        print("  --y=N       Y position in cells. Default: 0", file=sys.stderr)
-        print("  --w=N       Width in cells. Default: 40", file=sys.stderr)
-        print("  --h=N       Height in cells. Default: 20", file=sys.stderr)
-        sys.exit(1)
-
-    input_file = sys.argv[1]
-    raw_mode = '--raw' in sys.argv
+def write_base64(f, out):
+    """Stream file f to binary stream out as base64, a chunk at a time."""
+    while chunk := f.read(CHUNK_SIZE):
+        out.write(base64.b64encode(chunk))
 
-    # Parse options
-    plugin = None
-    mode = 'R'
-    x, y = 0, 0
-    w, h = 40, 20
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Encode a file to base64 and output the OSC sequence for yetty plugins.")
+    parser.add_argument("file")
+    parser.add_argument("--plugin", help="Plugin name: shader, image. Default: auto-detect")
+    parser.add_argument("--raw", action="store_true",
+                        help="Output only the base64 encoded string (no OSC wrapper)")
+    parser.add_argument("--mode", default="R", type=str.upper,
+                        help="Position mode: A (absolute) or R (relative). Default: R")
+    parser.add_argument("--x", type=int, default=0, help="X position in cells. Default: 0")
+    parser.add_argument("--y", type=int, default=0, help="Y position in cells. Default: 0")
+    parser.add_argument("--w", type=int, default=40, help="Width in cells. Default: 40")
+    parser.add_argument("--h", type=int, default=20, help="Height in cells. Default: 20")
+    return parser.parse_args()
 
-    for arg in sys.argv[2:]:
-        if arg.startswith('--plugin='):
-            plugin = arg.split('=')[1]
-        elif arg.startswith('--mode='):
-            mode = arg.split('=')[1].upper()
-        elif arg.startswith('--x='):
-            x = int(arg.split('=')[1])
-        elif arg.startswith('--y='):
-            y = int(arg.split('=')[1])
-        elif arg.startswith('--w='):
-            w = int(arg.split('=')[1])
-        elif arg.startswith('--h='):
-            h = int(arg.split('=')[1])
+def main():
+    args = parse_args()
+    input_file = args.file
+    raw_mode = args.raw
+    plugin, mode = args.plugin, args.mode
+    x, y, w, h = args.x, args.y, args.w, args.h
 
     # Auto-detect plugin from file extension
     if plugin is None:
@@ -66,18 +57,18 @@ def main():
         else:
             plugin = 'shader'  # default
 
+    out = sys.stdout.buffer
     with open(input_file, 'rb') as f:
-        data = f.read()
-
-    encoded = base64_encode(data)
-
-    if raw_mode:
-        print(encoded)
-    else:
-        # Output OSC sequence: ESC ] 99999;<plugin>;<mode>;<x>;<y>;<w>;<h>;<payload> ST
-        # Using ST (ESC \) instead of BEL (0x07) as terminator - more reliable through PTY
-        osc = f"\033]99999;{plugin};{mode};{x};{y};{w};{h};{encoded}\033\\"
-        print(osc, end='')
+        if raw_mode:
+            write_base64(f, out)
+            out.write(b'\n')
+        else:
+            # Output OSC sequence: ESC ] 99999;<plugin>;<mode>;<x>;<y>;<w>;<h>;<payload> ST
+            # Using ST (ESC \) instead of BEL (0x07) as terminator - more reliable through PTY
+            out.write(f"\033]99999;{plugin};{mode};{x};{y};{w};{h};".encode())
+            write_base64(f, out)
+            out.write(b'\033\\')
+    out.flush()
 
 if __name__ == '__main__':
     main()
@@ -198,6 +198,16 @@ ROUTES = {
 }
 
 
+def _static_response(path, page):
+    content_type = "text/css" if path.endswith(".css") else "text/html"
+    data = page.encode("utf-8")
+    return f"{content_type}; charset=utf-8", data, str(len(data))
+
+
+# Static routes encoded once: path -> (Content-Type, body bytes, Content-Length)
+STATIC_RESPONSES = {path: _static_response(path, page) for path, page in ROUTES.items()}
+
+
 class TestHandler(http.server.BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         pass  # silence request logging
@@ -228,9 +238,9 @@ class TestHandler(http.server.BaseHTTPRequestHandler):
             return
 
         # Static routes
-        if path in ROUTES:
-            content_type = "text/css" if path.endswith(".css") else "text/html"
-            self._send(200, ROUTES[path], content_type)
+        static = STATIC_RESPONSES.get(path)
+        if static is not None:
+            self._send_bytes(200, *static)
             return
 
         # Link targets: return simple pages confirming navigation
@@ -271,9 +281,12 @@ class TestHandler(http.server.BaseHTTPRequestHandler):
 
     def _send(self, code, body, content_type="text/html"):
         data = body.encode("utf-8")
+        self._send_bytes(code, f"{content_type}; charset=utf-8", data, str(len(data)))
+
+    def _send_bytes(self, code, content_type, data, content_length):
         self.send_response(code)
-        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", content_length)
         self.end_headers()
         self.wfile.write(data)
 
@@ -0,0 +1,205 @@
+//=============================================================================
+// YPaint SDFPrimitive codec tests — readPrimitive / writePrimitive /
+// computeCompactSize for every type ID against a test-local SDFPrimitive.
+//
+// Built once per layout (see CMakeLists.txt): the contiguous 96-byte layout,
+// where PrimCodec copies the header and style members as blocks;
+// SDF_TEST_PADDED_LAYOUT, where padding forces the per-member fallback; and
+// SDF_TEST_DOUBLE_ROUND_LAYOUT, where the style offsets line up but a double
+// round must still take the converting per-member path.
+//=============================================================================
+
+// Include C++ standard headers BEFORE boost/ut.hpp to prevent cdb's 'version'
+// file from shadowing C++20's <version> header
+#include <cstddef>
+#include <version>
+#include <algorithm>
+
+#include <boost/ut.hpp>
+
+#include <cstdint>
+#include <cstring>
+#include <type_traits>
+#include <vector>
+
+namespace yetty::card {
+struct SDFPrimitive {
+    uint32_t type;
+#ifdef SDF_TEST_PADDED_LAYOUT
+    uint32_t pad0;
+#endif
+    uint32_t layer;
+    float params[12];
+#ifdef SDF_TEST_DOUBLE_ROUND_LAYOUT
+    uint32_t pad0;  // puts the 8-byte aligned round right after strokeWidth
+#endif
+    uint32_t fillColor;
+    uint32_t strokeColor;
+#ifdef SDF_TEST_PADDED_LAYOUT
+    uint32_t pad1;
+#endif
+    float strokeWidth;
+#ifdef SDF_TEST_DOUBLE_ROUND_LAYOUT
+    double round;
+#else
+    float round;
+#endif
+    float aabbMinX, aabbMinY, aabbMaxX, aabbMaxY;
+};
+} // namespace yetty::card
+
+#define YETTY_CARD_SDF_PRIMITIVE_DEFINED
+#include "yetty/ypaint/ypaint-types.gen.h"
+#include "yetty/ypaint/ypaint-prim-writer.gen.h"
+
+using namespace boost::ut;
+using namespace yetty;
+using namespace yetty::card;
+
+static_assert(std::is_standard_layout_v<SDFPrimitive> && std::is_trivially_copyable_v<SDFPrimitive>,
+              "every test layout must allow offsetof and memcpy");
+
+#if defined(SDF_TEST_PADDED_LAYOUT)
+static_assert(!sdf::detail::kHeaderContiguous && !sdf::detail::kStyleContiguous,
+              "padded layout must take the per-member path");
+#elif defined(SDF_TEST_DOUBLE_ROUND_LAYOUT)
+static_assert(offsetof(SDFPrimitive, round) == offsetof(SDFPrimitive, fillColor) + 3 * sizeof(float),
+              "style offsets must line up so only the member type guard applies");
+static_assert(sdf::detail::kHeaderContiguous && !sdf::detail::kStyleContiguous,
+              "a double round must take the per-member path");
+#else
+static_assert(sdf::detail::kHeaderContiguous && sdf::detail::kStyleContiguous,
+              "contiguous layout must take the block-copy path");
+#endif
+
+// One past the largest SDFType ID, plus a few unknown IDs
+static constexpr uint32_t kTypeIdLimit = 140;
+
+// Every member nonzero so a member read into the wrong slot shows up
+static SDFPrimitive makePrim(uint32_t type) {
+    SDFPrimitive p{};
+    p.type = type;
+    p.layer = 1000 + type;
+    for (uint32_t i = 0; i < 12; i++) {
+        p.params[i] = 1.5f + static_cast<float>(i) + 0.01f * static_cast<float>(type);
+    }
+    p.fillColor = 0xFF000000u | type;
+    p.strokeColor = 0x00FF0000u | type;
+    p.strokeWidth = 2.25f;
+    p.round = 0.3f;  // nonzero low word even when widened to double
+    p.aabbMinX = -1.0f; p.aabbMinY = -2.0f;
+    p.aabbMaxX = 3.0f;  p.aabbMaxY = 4.0f;
+    return p;
+}
+
+template<typename T>
+static bool sameOrZero(T got, T want) {
+    return got == want || got == T{};
+}
+
+// readPrimitive only sets the members of the type's layout; the rest
+// (including padding and the AABB) must come back zeroed
+static bool readBackMatches(const SDFPrimitive& got, const SDFPrimitive& want) {
+    if (got.type != want.type) return false;
+    if (!sameOrZero(got.layer, want.layer)) return false;
+    for (uint32_t i = 0; i < 12; i++) {
+        if (!sameOrZero(got.params[i], want.params[i])) return false;
+    }
+    if (!sameOrZero(got.fillColor, want.fillColor)) return false;
+    if (!sameOrZero(got.strokeColor, want.strokeColor)) return false;
+    if (!sameOrZero(got.strokeWidth, want.strokeWidth)) return false;
+    if (!sameOrZero(got.round, want.round)) return false;
+#if defined(SDF_TEST_PADDED_LAYOUT)
+    if (got.pad0 != 0 || got.pad1 != 0) return false;
+#elif defined(SDF_TEST_DOUBLE_ROUND_LAYOUT)
+    if (got.pad0 != 0) return false;
+#endif
+    return got.aabbMinX == 0.0f && got.aabbMinY == 0.0f &&
+           got.aabbMaxX == 0.0f && got.aabbMaxY == 0.0f;
+}
+
+suite codec_tests = [] {
+
+    "every type ID round-trips through write/read/write"_test = [] {
+        uint32_t known = 0;
+        for (uint32_t t = 0; t < kTypeIdLimit; t++) {
+            SDFPrimitive prim = makePrim(t);
+            float buf[32] = {};
+            uint32_t wc = sdf::writePrimitive(buf, prim);
+            expect(wc == sdf::wordCountForType(t)) << "word count, type" << t;
+            if (wc == 0) {
+                sdf::detail::write_u32(buf, 0, t);
+                SDFPrimitive out;
+                expect(sdf::readPrimitive(buf, out) == 0u) << "unknown type" << t;
+                continue;
+            }
+            known++;
+            expect(sdf::detail::read_u32(buf, 0) == t) << "type word, type" << t;
+
+            SDFPrimitive out;
+            std::memset(&out, 0xAB, sizeof(out));
+            expect(sdf::readPrimitive(buf, out) == wc) << "read count, type" << t;
+            expect(readBackMatches(out, prim)) << "read-back members, type" << t;
+
+            float again[32] = {};
+            expect(sdf::writePrimitive(again, out) == wc) << "rewrite count, type" << t;
+            expect(std::memcmp(buf, again, wc * sizeof(float)) == 0) << "rewrite words, type" << t;
+        }
+        expect(known == 63_u) << "types with a buffer layout";
+    };
+
+    "circle words match writeCircle"_test = [] {
+        SDFPrimitive prim = makePrim(static_cast<uint32_t>(SDFType::Circle));
+        float buf[9], ref[9];
+        expect(sdf::writePrimitive(buf, prim) == 9_u);
+        sdf::writeCircle(ref, prim.layer, prim.params[0], prim.params[1], prim.params[2],
+                         prim.fillColor, prim.strokeColor, prim.strokeWidth, prim.round);
+        expect(std::memcmp(buf, ref, sizeof(buf)) == 0);
+
+        SDFPrimitive out;
+        expect(sdf::readPrimitive(ref, out) == 9_u);
+        expect(out.layer == prim.layer);
+        expect(out.params[0] == prim.params[0]);
+        expect(out.params[2] == prim.params[2]);
+        expect(out.params[3] == 0.0_f);
+        expect(out.fillColor == prim.fillColor);
+        expect(out.strokeColor == prim.strokeColor);
+        expect(out.strokeWidth == prim.strokeWidth);
+        expect(out.round == prim.round);
+    };
+
+    "text glyph keeps u32 geometry bits"_test = [] {
+        float buf[11];
+        sdf::writeTextGlyph(buf, 3, 10.0f, 20.0f, 1.5f, 2.5f, 0x00ABCDEFu,
+                            0xFFFFFFFFu, 0x11223344u, 0.5f, 0.0f);
+        SDFPrimitive out;
+        expect(sdf::readPrimitive(buf, out) == 11_u);
+        uint32_t glyph;
+        std::memcpy(&glyph, &out.params[4], sizeof(glyph));
+        expect(glyph == 0x00ABCDEFu);
+        expect(out.layer == 3_u);
+        expect(out.params[3] == 2.5_f);
+        expect(out.fillColor == 0xFFFFFFFFu);
+        expect(out.strokeColor == 0x11223344u);
+        expect(out.strokeWidth == 0.5_f);
+    };
+
+    "computeCompactSize counts the offset table and per-type words"_test = [] {
+        std::vector<SDFPrimitive> prims = {
+            makePrim(static_cast<uint32_t>(SDFType::Circle)),
+            makePrim(static_cast<uint32_t>(SDFType::Box)),
+            makePrim(45),  // no buffer layout: one placeholder word
+        };
+        expect(sdf::computeCompactSize(prims.data(), 3) == (3u + 9u + 10u + 1u) * 4u);
+
+        prims.clear();
+        uint32_t words = 0;
+        for (uint32_t t = 0; t < kTypeIdLimit; t++) {
+            prims.push_back(makePrim(t));
+            float buf[32];
+            words += std::max(sdf::writePrimitive(buf, prims.back()), 1u);
+        }
+        auto count = static_cast<uint32_t>(prims.size());
+        expect(sdf::computeCompactSize(prims.data(), count) == (count + words) * 4u);
+    };
+};
@@ -754,6 +754,82 @@ suite aabb_tests = [] {
     };
 };
 
+//=============================================================================
+// Grid translation tests — the dispatching translateGridEntries, the scalar
+// kernel and (on AVX2 CPUs) the AVX2 kernel must agree on every case
+//=============================================================================
+
+using GridKernel = void (*)(uint32_t*, uint32_t, uint32_t, const uint32_t*, uint32_t);
+
+static void expectTranslated(const std::vector<uint32_t>& grid,
+                             uint32_t gridW, uint32_t gridH,
+                             const std::vector<uint32_t>& wordOffsets,
+                             const std::vector<uint32_t>& expected) {
+    auto gridSize = static_cast<uint32_t>(grid.size());
+    auto numOffsets = static_cast<uint32_t>(wordOffsets.size());
+
+    auto dispatched = grid;
+    sdf::translateGridEntries(dispatched.data(), gridSize, gridW, gridH, wordOffsets);
+    expect(dispatched == expected) << "translateGridEntries";
+
+    std::vector<std::pair<const char*, GridKernel>> kernels = {
+        {"scalar", &sdf::detail::translateGridEntriesScalar},
+    };
+#if YETTY_SDF_AVX2_DISPATCH
+    if (__builtin_cpu_supports("avx2")) {
+        kernels.push_back({"avx2", &sdf::detail::translateGridEntriesAvx2});
+    }
+#endif
+    for (auto [name, kernel] : kernels) {
+        auto g = grid;
+        kernel(g.data(), gridSize, gridW * gridH, wordOffsets.data(), numOffsets);
+        expect(g == expected) << name << "kernel";
+    }
+}
+
+suite translate_grid_tests = [] {
+
+    "glyph entries pass through"_test = [] {
+        // cell 0 at word 1: [count=3][glyph][prim 1][glyph]
+        expectTranslated({1, 3, 0x80000005u, 1, 0x80000000u}, 1, 1,
+                         {10, 20, 30},
+                         {1, 3, 0x80000005u, 20, 0x80000000u});
+    };
+
+    "indices past wordOffsets pass through"_test = [] {
+        expectTranslated({1, 3, 2, 3, 7}, 1, 1,
+                         {10, 20, 30},
+                         {1, 3, 30, 3, 7});
+    };
+
+    "cell with more than 8 entries — vector body and scalar tail"_test = [] {
+        // cell 0 at word 2 holds 11 entries, word 14 belongs to no cell,
+        // cell 1 at word 15 holds 2 entries
+        expectTranslated(
+            {2, 15,
+             11, 0, 1, 0x80000001u, 2, 9, 3, 0x80000002u, 4, 5, 100, 1,
+             2,
+             2, 6, 0x80000006u},
+            2, 1,
+            {100, 101, 102, 103, 104, 105, 106},
+            {2, 15,
+             11, 100, 101, 0x80000001u, 102, 9, 103, 0x80000002u, 104, 105, 100, 101,
+             2,
+             2, 106, 0x80000006u});
+    };
+
+    "count running past gridSize is clamped"_test = [] {
+        // count claims 50 entries but only 9 words remain
+        expectTranslated({1, 50, 0, 1, 2, 0, 1, 2, 0, 1, 2}, 1, 1,
+                         {7, 8, 9},
+                         {1, 50, 7, 8, 9, 7, 8, 9, 7, 8, 9});
+    };
+
+    "empty wordOffsets leaves the grid untouched"_test = [] {
+        expectTranslated({1, 2, 0, 1}, 1, 1, {}, {1, 2, 0, 1});
+    };
+};
+
 //=============================================================================
 // Full GPU write pipeline tests — using MockGpuMemoryManager
 //
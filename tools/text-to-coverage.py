@@ -4,13 +4,8 @@ import sys
 
 COVERAGE_BASE = 0xF1000
 
+# ASCII except newline -> base + code; non-ASCII is absent and passes through
+TABLE = {i: COVERAGE_BASE + i for i in range(128) if i != ord("\n")}
+
 for line in sys.stdin:
-    out = ""
-    for c in line:
-        if c == '\n':
-            out += c
-        elif ord(c) < 128:
-            out += chr(COVERAGE_BASE + ord(c))
-        else:
-            out += c  # Pass through non-ASCII
-    sys.stdout.write(out)
+    sys.stdout.write(line.translate(TABLE))